@@ -8,7 +8,9 @@ from typing import List, Dict
 import os
 
 # this should never be True in real config files
-IS_EXAMPLE_CONFIG: bool = os.path.exists(os.path.join(Path(__file__).parent, "engine.py")) and os.path.exists(os.path.join(Path(__file__).parent, "data_collector.py"))
+# (single listdir syscall instead of a stat call per checked file)
+_app_dir_entries = set(os.listdir(Path(__file__).parent))
+IS_EXAMPLE_CONFIG: bool = {"engine.py", "data_collector.py"}.issubset(_app_dir_entries)
 
 # application name and folder path
 APP_NAME: str = Path(__file__).stem
@@ -18,7 +20,7 @@ APP_DIR: Path = Path(__file__).parent
 ENGINE_DIR: Path = Path(os.path.join(str(APP_DIR), "..", ".."))
 
 # engine path sanity
-if not IS_EXAMPLE_CONFIG and not os.path.exists(ENGINE_DIR / "engine.py"):
+if not IS_EXAMPLE_CONFIG and not (ENGINE_DIR / "engine.py").is_file():
     raise RuntimeError("Missing engine.py file! All Dashium applications must be located under Dashium /apps/<app_name>/ path or they won't work.")
 
 # data folder path
@@ -62,10 +64,10 @@ DATA_COLLECTORS: List[Dict] = []
 # allow additional data collectors config in seperate file
 try:
     import config_data_collectors  # type: ignore
-    for collector in config_data_collectors.DATA_COLLECTORS:
-        DATA_COLLECTORS.append(collector)
 except ModuleNotFoundError:
     pass
+else:
+    DATA_COLLECTORS.extend(config_data_collectors.DATA_COLLECTORS)
 
 
 # views (dashboards) to register
@@ -74,10 +76,10 @@ VIEWS: List[Dict] = []
 # allow additional views config in seperate file
 try:
     import config_views  # type: ignore
-    for view in config_views.VIEWS:
-        VIEWS.append(view)
 except ModuleNotFoundError:
     pass
+else:
+    VIEWS.extend(config_views.VIEWS)
 
 
 # web server configuration - host and port to serve on
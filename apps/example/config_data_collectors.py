@@ -1,42 +1,28 @@
+import re
 from pathlib import Path
 
 
+def _system_collector(module: str, retention_days: int = 60) -> dict:
+    """Build a standard system metrics collector entry (they all share the same shape)."""
+    return {
+        "module": module,
+        "collect_interval_in_minutes": 5,
+        "config": {"retention_days": retention_days, "collect_when_server_starts": True}
+    }
+
+
 DATA_COLLECTORS = [
     {
-        "module": "example_data_collector", 
-        "collect_interval_in_minutes": 1, 
+        "module": "example_data_collector",
+        "collect_interval_in_minutes": 1,
         "config": {}
     },
-    {
-        "module": "cpu_usage", 
-        "collect_interval_in_minutes": 5, 
-        "config": {"retention_days": 60, "collect_when_server_starts": True}
-    },
-    {
-        "module": "memory_usage", 
-        "collect_interval_in_minutes": 5, 
-        "config": {"retention_days": 60, "collect_when_server_starts": True}
-    },
-    {
-        "module": "network_usage", 
-        "collect_interval_in_minutes": 5, 
-        "config": {"retention_days": 60, "collect_when_server_starts": True}
-    },
-    {
-        "module": "io_operations", 
-        "collect_interval_in_minutes": 5, 
-        "config": {"retention_days": 60, "collect_when_server_starts": True}
-    },
-    {
-        "module": "processes_count", 
-        "collect_interval_in_minutes": 5, 
-        "config": {"retention_days": 60, "collect_when_server_starts": True}
-    },
-    {
-        "module": "windows_counters", 
-        "collect_interval_in_minutes": 5, 
-        "config": {"retention_days": 7, "collect_when_server_starts": True}
-    },
+    _system_collector("cpu_usage"),
+    _system_collector("memory_usage"),
+    _system_collector("network_usage"),
+    _system_collector("io_operations"),
+    _system_collector("processes_count"),
+    _system_collector("windows_counters", retention_days=7),
     {
         "module": "disk_usage", 
         "collect_interval_in_minutes": 10, 
@@ -52,7 +38,8 @@ DATA_COLLECTORS = [
         "collect_interval_in_minutes": 1, 
         "config": {
             "log_file_path": str(Path(__file__).parent / 'logs' / 'app.log'),
-            "log_pattern": r'^(\w+)\s*\|\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2},\d{3})\s*\|\s*([^|]+)\s*\|\s*(.+)$',
+            # precompiled once here so the collector doesn't re-compile per line
+            "log_pattern": re.compile(r'^(\w+)\s*\|\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2},\d{3})\s*\|\s*([^|]+)\s*\|\s*(.+)$'),
             "timestamp_format": '%Y-%m-%d %H:%M:%S,%f',
             "timestamp_group_index": 2,
             "severity_group_index": 1,
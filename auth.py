@@ -4,7 +4,11 @@ Author: Ronen Ness.
 Created: 2025.
 """
 import hashlib
+import hmac
 import secrets
+import sys
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Tuple
 import logger
@@ -17,26 +21,30 @@ class User:
     """
     Represents a user with username and hashed password.
     """
-    
-    def __init__(self, username: str, hashed_password: str) -> None:
+    __slots__ = ("username", "hashed_password", "salt")
+
+    def __init__(self, username: str, hashed_password: str, salt: bytes) -> None:
         """
         Initialize a User object.
-        
+
         Args:
             username (str): The username
-            hashed_password (str): The hashed password
-            
+            hashed_password (str): The scrypt-derived password hash (hex)
+            salt (bytes): Per-user random salt used for the scrypt derivation
+
         Returns:
             None
         """
         self.username = username
         self.hashed_password = hashed_password
+        self.salt = salt
 
 
 class Session:
     """
     Represents a user session with access tracking.
     """
+    __slots__ = ("user", "session_id", "created_at", "last_access", "debug_id")
     _next_session_debug_id = 1
     
     def __init__(self, user: User, session_id: str) -> None:
@@ -52,19 +60,29 @@ class Session:
         """
         self.user = user
         self.session_id = session_id
+        # wall-clock time is only kept for display, hot paths use monotonic floats
         self.created_at = datetime.now()
-        self.last_access = datetime.now()
+        self.last_access = time.monotonic()
         self.debug_id = Session._next_session_debug_id
         Session._next_session_debug_id += 1
 
     def update_access(self) -> None:
         """
         Update the last access time for this session.
-        
+
         Returns:
             None
         """
-        self.last_access = datetime.now()
+        self.last_access = time.monotonic()
+
+    def last_access_datetime(self) -> datetime:
+        """
+        Get the last access time as wall-clock datetime (for display purposes).
+
+        Returns:
+            datetime: Approximate wall-clock time of the last access
+        """
+        return datetime.now() - timedelta(seconds=time.monotonic() - self.last_access)
 
 
 class AuthenticationManager:
@@ -84,29 +102,51 @@ class AuthenticationManager:
         Returns:
             None
         """
-        self.users: List[User] = []
-        self.sessions: Dict[str, Session] = {}
+        self.users: Dict[str, User] = {}
+        # Sessions are kept in LRU order (oldest last_access first) so expiry
+        # scans can stop at the first non-expired entry.
+        self.sessions: "OrderedDict[str, Session]" = OrderedDict()
         self.failed_attempts = 0
-        self.lock_until: Optional[datetime] = None
+        self.lock_until: Optional[float] = None
         self.session_timeout_hours = session_timeout_hours
         self.lock_after_failed_attempts = lock_after_failed_attempts
         self.lock_after_failed_attempts_time_minutes = lock_after_failed_attempts_time_minutes
 
+        # precomputed values in seconds to compare against time.monotonic() without timedelta allocations
+        self._session_timeout_secs = session_timeout_hours * 3600
+        self._lock_secs = lock_after_failed_attempts_time_minutes * 60
+
         # Start the session cleanup timer (convert hours to minutes)
         timer.register_timer(self._cleanup_sessions, 30)
-        log.info(f"Authentication manager initialized with {session_timeout_hours}h session timeout")
+        log.info("Authentication manager initialized with %sh session timeout", session_timeout_hours)
     
     def _hash_password(self, password: str) -> str:
         """
         Hash a password using SHA-256.
-        
+        This is the 'wire format' hash - what clients send instead of the raw password.
+
         Args:
             password (str): Raw password to hash
-            
+
         Returns:
             str: Hashed password
         """
         return hashlib.sha256(password.encode('utf-8')).hexdigest()
+
+    def _kdf_password(self, hashed_password: str, salt: bytes) -> str:
+        """
+        Derive the stored password hash from the wire-format hash using scrypt.
+        Unlike plain SHA-256, scrypt is salted and memory-hard, so stored hashes
+        can't be attacked with rainbow tables.
+
+        Args:
+            hashed_password (str): SHA-256 wire-format password hash
+            salt (bytes): Per-user random salt
+
+        Returns:
+            str: Derived hash (hex)
+        """
+        return hashlib.scrypt(hashed_password.encode('utf-8'), salt=salt, n=2**14, r=8, p=1, dklen=32).hex()
     
     def _generate_session_id(self) -> str:
         """
@@ -129,17 +169,19 @@ class AuthenticationManager:
             bool: True if user was created successfully, False if username already exists
         """
         # Check if username already exists
-        for user in self.users:
-            if user.username == username:
-                log.warning(f"Attempted to create user '{username}' but username already exists")
-                return False
-        
-        # Create new user with hashed password
-        hashed_password = self._hash_password(raw_password)
-        new_user = User(username, hashed_password)
-        self.users.append(new_user)
+        if username in self.users:
+            log.warning("Attempted to create user '%s' but username already exists", username)
+            return False
+
+        # intern the username - it's shared by every session of this user
+        username = sys.intern(username)
+
+        # Create new user with salted scrypt hash (derived from the wire-format SHA-256)
+        salt = secrets.token_bytes(16)
+        hashed_password = self._kdf_password(self._hash_password(raw_password), salt)
+        self.users[username] = User(username, hashed_password, salt)
         
-        log.info(f"Created new user: {username}")
+        log.info("Created new user: %s", username)
         return True
     
     def is_locked(self) -> bool:
@@ -152,7 +194,7 @@ class AuthenticationManager:
         if self.lock_until is None:
             return False
         
-        if datetime.now() >= self.lock_until:
+        if time.monotonic() >= self.lock_until:
             # Lock has expired
             self.lock_until = None
             self.failed_attempts = 0
@@ -175,34 +217,36 @@ class AuthenticationManager:
         """
         # Check if manager is locked
         if self.is_locked():
-            log.warning(f"Authentication attempt for '{username}' rejected - manager is locked")
+            log.warning("Authentication attempt for '%s' rejected - manager is locked", username)
             return None
         
-        # Hash the provided password
-        hashed_password = password if password_is_hashed else self._hash_password(password)
-        
-        # Find user and check password
-        for user in self.users:
-            if user.username == username and user.hashed_password == hashed_password:
+        # Find user first so we don't waste hashing work on unknown usernames
+        user = self.users.get(username)
+
+        # Hash the provided password and check it (only if user exists)
+        if user is not None:
+            wire_hash = password if password_is_hashed else self._hash_password(password)
+            hashed_password = self._kdf_password(wire_hash, user.salt)
+            if hmac.compare_digest(user.hashed_password, hashed_password):
                 # Authentication successful
                 session_id = self._generate_session_id()
                 session = Session(user, session_id)
                 self.sessions[session_id] = session
-                
+
                 # Reset failed attempts on successful login
                 self.failed_attempts = 0
-                
-                log.info(f"User '{username}' authenticated successfully with session {session_id}")
+
+                log.info("User '%s' authenticated successfully with session %s", username, session_id)
                 return user, session_id
         
         # Authentication failed
         self.failed_attempts += 1
-        log.warning(f"Authentication failed for '{username}' (attempt {self.failed_attempts}/10)")
+        log.warning("Authentication failed for '%s' (attempt %s/10)", username, self.failed_attempts)
         
         # Check if we should lock the manager
         if self.failed_attempts >= self.lock_after_failed_attempts:
-            self.lock_until = datetime.now() + timedelta(minutes=self.lock_after_failed_attempts_time_minutes)
-            log.error(f"Authentication manager locked for {self.lock_after_failed_attempts_time_minutes} minutes due to {self.failed_attempts} failed attempts")
+            self.lock_until = time.monotonic() + self._lock_secs
+            log.error("Authentication manager locked for %s minutes due to %s failed attempts", self.lock_after_failed_attempts_time_minutes, self.failed_attempts)
 
         return None
     
@@ -219,7 +263,7 @@ class AuthenticationManager:
                 "username": session.user.username,
                 "debug_id": session.debug_id,
                 "created_at": session.created_at.isoformat(),
-                "last_active_at": session.last_access.isoformat()
+                "last_active_at": session.last_access_datetime().isoformat()
             })
         return active_sessions
     
@@ -239,14 +283,15 @@ class AuthenticationManager:
         session = self.sessions[session_id]
         
         # Check if session has expired
-        if datetime.now() - session.last_access > timedelta(hours=self.session_timeout_hours):
+        if time.monotonic() - session.last_access > self._session_timeout_secs:
             # Session expired, remove it
             del self.sessions[session_id]
-            log.info(f"Session {session_id} expired and was removed")
+            log.info("Session %s expired and was removed", session_id)
             return None
         
-        # Update last access time
+        # Update last access time and keep LRU order (most recent last)
         session.update_access()
+        self.sessions.move_to_end(session_id)
         return session.user
     
     def logout(self, session_id: str) -> bool:
@@ -262,7 +307,7 @@ class AuthenticationManager:
         if session_id in self.sessions:
             username = self.sessions[session_id].user.username
             del self.sessions[session_id]
-            log.info(f"User '{username}' logged out, session {session_id} removed")
+            log.info("User '%s' logged out, session %s removed", username, session_id)
             return True
         return False
     
@@ -273,22 +318,24 @@ class AuthenticationManager:
         Returns:
             None
         """
-        now = datetime.now()
+        now = time.monotonic()
         expired_sessions = []
 
         self.failed_attempts = 0  # Reset failed attempts during cleanup
-        
+
+        # Sessions are in LRU order, so we can stop at the first non-expired one
         for session_id, session in self.sessions.items():
-            if now - session.last_access > timedelta(hours=self.session_timeout_hours):
-                expired_sessions.append(session_id)
-        
+            if now - session.last_access <= self._session_timeout_secs:
+                break
+            expired_sessions.append(session_id)
+
         for session_id in expired_sessions:
             username = self.sessions[session_id].user.username
             del self.sessions[session_id]
-            log.info(f"Cleaned up expired session {session_id} for user '{username}'")
+            log.info("Cleaned up expired session %s for user '%s'", session_id, username)
         
         if expired_sessions:
-            log.info(f"Session cleanup completed: removed {len(expired_sessions)} expired sessions")
+            log.info("Session cleanup completed: removed %s expired sessions", len(expired_sessions))
     
     def get_active_sessions_count(self) -> int:
         """
@@ -3,7 +3,7 @@ Implement the job that collects events from data collectors.
 Author: Ronen Ness.
 Created: 2025.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from data_collector import DataCollector
 from db import DatabaseManager
 import timer
@@ -16,14 +16,29 @@ log = logger.get_logger("collect_events")
 db: DatabaseManager = None # type: ignore
 data_collectors: List[DataCollector] = None # type: ignore
 
+# index for O(1) status lookups, built when the engine sets the collectors
+_status_index: Dict[Tuple[str, str], DataCollector] = {}
+
+
+def init(collectors: List[DataCollector]) -> None:
+    """
+    Set the data collectors list and build the status lookup index.
+
+    Args:
+        collectors (List[DataCollector]): Data collectors loaded by the engine.
+    """
+    global data_collectors, _status_index
+    data_collectors = collectors
+    _status_index = {(dc.module_name, dc.unique_id): dc for dc in collectors}
+
 
 def get_data_collector_status(module: str, unique_id: str = "") -> Optional[dict]:
     """Get the status of a data collector module."""
-    for data_collector in data_collectors:
-        if data_collector.module_name == module and data_collector.unique_id == unique_id:
-            return data_collector.get_status()
+    data_collector = _status_index.get((module, unique_id))
+    if data_collector is not None:
+        return data_collector.get_status()
 
-    log.warning(f"Data collector not found for module: {module}, unique_id: {unique_id}")
+    log.warning("Data collector not found for module: %s, unique_id: %s", module, unique_id)
     return None
 
 
@@ -31,7 +46,7 @@ def get_data_collector_status(module: str, unique_id: str = "") -> Optional[dict
 def collect_data():
     """Run data collection task."""
 
-    log.debug(f"Start events collection job..")
+    log.debug("Start events collection job..")
 
     # iterate over data collectors and collect data
     for data_collector in data_collectors:
@@ -40,27 +55,29 @@ def collect_data():
         if not data_collector.need_to_run():
             continue
         
-        # collect data
-        results = data_collector.collect()
-        log.info(f"Events collected from {data_collector.module_name}: {len(results)}")
+        # collect data - the collector already counted and logged the error, just
+        # keep going so one broken collector can't starve the ones after it
+        try:
+            results = data_collector.collect()
+        except Exception:
+            continue
+        log.info("Events collected from %s: %s", data_collector.module_name, len(results))
         
-        # validate and filter results
-        valid_results = []
-        for result in results:
-            if 'name' not in result:
-                log.warning(f"Skipping invalid event collected from {data_collector.module_name}: missing 'name' key.")
-                continue
-            valid_results.append(result)
+        # validate and filter results (single C-level comprehension, log rejects once)
+        valid_results = [result for result in results if 'name' in result]
+        rejects = len(results) - len(valid_results)
+        if rejects:
+            log.warning("Skipped %s invalid events collected from %s: missing 'name' key.", rejects, data_collector.module_name)
         
         # bulk insert all valid events for this collector
         if valid_results:
             success = db.insert_events_bulk(valid_results)
             if not success:
-                log.error(f"Failed to insert {len(valid_results)} events from {data_collector.module_name}")
+                log.error("Failed to insert %s events from %s", len(valid_results), data_collector.module_name)
             else:
-                log.debug(f"Successfully bulk inserted {len(valid_results)} events from {data_collector.module_name}")
+                log.debug("Successfully bulk inserted %s events from %s", len(valid_results), data_collector.module_name)
 
-    log.debug(f"Finished events collection job.")
+    log.debug("Finished events collection job.")
 
 
 # register the data collection task to run periodically
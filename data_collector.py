@@ -6,6 +6,7 @@ Created: 2025.
 """
 import sys
 import os
+import time
 import importlib.util
 from pathlib import Path
 from datetime import datetime
@@ -18,11 +19,44 @@ from persistent_state import PersistentState
 
 log = logger.get_logger("data_collector")
 
+# data dir stringified once, so per-collector init doesn't rebuild PurePath objects
+_DATA_DIR_STR = str(config.DATA_DIR) + os.sep
+
+# map of collector name -> module path, built once with a single scandir per search
+# directory instead of a stat call per collector (app dir takes precedence)
+_collector_index: Dict[str, Path] = {}
+
+
+def _build_collector_index() -> Dict[str, Path]:
+    """
+    Build (once) and return the map of available collector modules.
+
+    Returns:
+        Dict[str, Path]: Collector script name (without .py) to module path
+    """
+    if not _collector_index:
+        for search_path in [config.APP_DIR, config.ENGINE_DIR]:
+            try:
+                with os.scandir(os.path.join(search_path, "data_collectors")) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".py"):
+                            _collector_index.setdefault(entry.name[:-3], Path(entry.path))
+            except FileNotFoundError:
+                continue
+    return _collector_index
+
+
 class DataCollector:
     """
     Dynamically load and interface with a data source module.
     """
 
+    # slots cut per-instance memory and speed up the attribute access in collect() / get_status()
+    __slots__ = ("module_name", "module", "_module_path", "interval_in_minutes", "config",
+                 "last_execution_time", "_interval_seconds", "_last_exec_mono", "runs_count",
+                 "errors_count", "collected_events", "avg_execution_time_ms", "cleanup_times",
+                 "deleted_events_count", "unique_id", "_persistent_state_path", "persistent_state")
+
     def __init__(self, collector_script_name: str, interval_in_minutes: int, collector_config: Optional[Dict[str, Any]] = None, unique_id: str = "") -> None:
         """
         Initialize the data source by loading the specified collector script.
@@ -39,32 +73,23 @@ class DataCollector:
         # store collector module name
         self.module_name = collector_script_name
 
-        # load the collector module
+        # locate the collector module, but defer the actual import to the first use
+        # so that server boot doesn't serialize all collector top-level imports
         self.module = None
-        for search_path in [config.APP_DIR, config.ENGINE_DIR]:
-            path = Path(os.path.join(search_path, "data_collectors", collector_script_name + ".py"))
-            if os.path.exists(path):
-                spec = importlib.util.spec_from_file_location(path.stem, path)
-                module = importlib.util.module_from_spec(spec) # type: ignore
-                sys.modules[path.stem] = module # type: ignore
-                spec.loader.exec_module(module) # type: ignore
-                self.module = module
+        self._module_path: Optional[Path] = _build_collector_index().get(collector_script_name)
 
         # not found?
-        if not self.module:
+        if not self._module_path:
             raise FileNotFoundError(f"Could not locate data collector: {collector_script_name}.")
 
-        # init data collector
-        try:
-            self.module.init()  # type: ignore
-        except Exception as e:
-            log.error(f"Data collector {collector_script_name} has no init() function or it failed: {e}")
-            raise e
-
         # set other properties
         self.interval_in_minutes = interval_in_minutes
         self.config = collector_config or {}
         self.last_execution_time = datetime.now()
+
+        # precomputed interval and monotonic last-run time so need_to_run() is a single float compare
+        self._interval_seconds = interval_in_minutes * 60.0
+        self._last_exec_mono = time.monotonic()
         self.runs_count = 0
         self.errors_count = 0
         self.collected_events = 0
@@ -76,11 +101,40 @@ class DataCollector:
         self.unique_id = unique_id
         
         # create persistent state object
-        self._persistent_state_path = str(config.DATA_DIR / self.config.get('persistent_state_file_name', f'{self.module_name}_{self.unique_id}_state.json'))
+        self._persistent_state_path = _DATA_DIR_STR + self.config.get('persistent_state_file_name', f'{self.module_name}_{self.unique_id}_state.json')
         self.persistent_state = PersistentState()
         self.persistent_state.load(self._persistent_state_path, False)
 
 
+    def _load_module(self) -> None:
+        """
+        Import and init the collector module, if not loaded yet.
+        Called lazily on the first collect() / get_retention_rules() invocation.
+
+        Returns:
+            None
+        """
+        if self.module is not None:
+            return
+
+        # load the collector module
+        path = self._module_path
+        spec = importlib.util.spec_from_file_location(path.stem, path) # type: ignore
+        module = importlib.util.module_from_spec(spec) # type: ignore
+        sys.modules[path.stem] = module # type: ignore
+        spec.loader.exec_module(module) # type: ignore
+
+        # init data collector - publish the module only after init() succeeds, so
+        # a failed init is retried on the next call instead of silently running a
+        # collector that never established its baseline
+        try:
+            module.init()
+        except Exception as e:
+            log.error(f"Data collector {self.module_name} has no init() function or it failed: {e}")
+            raise e
+        self.module = module
+
+
     def add_deleted_events_count(self, count: int) -> None:
         """
         Add to the count of deleted events by this data collector.
@@ -126,7 +180,7 @@ class DataCollector:
             return True
         
         # check if should run based on interval
-        return (datetime.now() - self.last_execution_time).total_seconds() / 60 >= self.interval_in_minutes
+        return (time.monotonic() - self._last_exec_mono) >= self._interval_seconds
 
 
     def collect(self) -> List[Any]:
@@ -137,10 +191,14 @@ class DataCollector:
             List[Any]: List of Event instances collected by the data source
         """
         try:
+            # make sure the collector module is loaded (lazy import on first run)
+            self._load_module()
+
             # update runs count and last execution time
             self.runs_count += 1
             prev_execution_time = self.last_execution_time
             self.last_execution_time = datetime.now()
+            self._last_exec_mono = time.monotonic()
 
             # collect data
             ret = self.module.collect(self.config, self.persistent_state, prev_execution_time) # type: ignore
@@ -148,9 +206,9 @@ class DataCollector:
             # save state
             self.persistent_state.save(self._persistent_state_path, True)
 
-            # update average execution time
+            # update average execution time (incremental running mean, stable for large runs_count)
             curr_execution_time = (datetime.now() - self.last_execution_time).total_seconds() * 1000
-            self.avg_execution_time_ms = (self.avg_execution_time_ms * (self.runs_count - 1) + curr_execution_time) / self.runs_count
+            self.avg_execution_time_ms += (curr_execution_time - self.avg_execution_time_ms) / self.runs_count
 
             # update collected events count
             self.collected_events += len(ret)
@@ -168,4 +226,5 @@ class DataCollector:
         Returns:
             List[Any]: List of retention rules for the data source
         """
+        self._load_module()
         return self.module.get_retention_rules(self.config) # type: ignore
\ No newline at end of file
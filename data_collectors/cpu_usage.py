@@ -3,16 +3,22 @@ Collect data about CPU usage.
 """
 from typing import Dict, List, Any
 from datetime import datetime
+import retention_rules
 
 error_message = None
 
 try:
     import psutil
+    import psutil_cache
 except ModuleNotFoundError:
     error_message = "psutil module must be installed to use cpu usage collector!"
     psutil = None
 
 
+# event names emitted by this collector
+_EVENT_NAMES = ("cpu_usage",)
+
+
 def init():
     """Initialize the data collector."""
     if psutil is not None:
@@ -34,7 +40,7 @@ def collect(config: Dict[str, Any], persistent_state: object, last_execution_tim
     if psutil is None:
         return []
     
-    cpu_percent = psutil.cpu_percent()
+    cpu_percent = psutil_cache.get_cpu_percent()
     return [{
         "name": "cpu_usage",
         "value": int(cpu_percent)
@@ -51,10 +57,4 @@ def get_retention_rules(config: Dict[str, Any]) -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of retention rule dictionaries
     """
-    rules = [
-        {
-            "event_name": "cpu_usage",
-            "max_age_days": config.get('retention_days', 7)
-        }
-    ]
-    return rules
\ No newline at end of file
+    return retention_rules.build_retention_rules(_EVENT_NAMES, config.get('retention_days', 7))
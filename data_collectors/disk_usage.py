@@ -3,16 +3,22 @@ Collect data about disk usage.
 """
 from typing import Dict, List, Any
 from datetime import datetime
+import retention_rules
 
 error_message = None
 
 try:
     import psutil
+    import psutil_cache
 except ModuleNotFoundError:
     error_message = "psutil module must be installed to use disk usage collector!"
     psutil = None
 
 
+# event names, in the same order as the values built in collect()
+_EVENT_NAMES = ("disk_usage_percent", "disk_usage_used_mb", "disk_usage_free_mb")
+
+
 def init():
     """Initialize the data collector."""
     pass
@@ -32,20 +38,11 @@ def collect(config: Dict[str, Any], persistent_state: object, last_execution_tim
     """
     if psutil is None:
         return []
-    
-    usage = psutil.disk_usage(config.get('path', '/'))
-    return [{
-        "name": "disk_usage_percent",
-        "value": int(usage.percent)
-    },
-    {
-        "name": "disk_usage_used_mb",
-        "value": int(usage.used / (1024 ** 2))
-    },
-    {
-        "name": "disk_usage_free_mb",
-        "value": int(usage.free / (1024 ** 2))
-    }]
+
+    usage = psutil_cache.get_disk_usage(config.get('path', '/'))
+    # byte counts are ints - shift to MB instead of float division
+    values = (int(usage.percent), usage.used >> 20, usage.free >> 20)
+    return [{"name": name, "value": value} for name, value in zip(_EVENT_NAMES, values)]
 
 
 def get_retention_rules(config: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -58,18 +55,4 @@ def get_retention_rules(config: Dict[str, Any]) -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of retention rule dictionaries
     """
-    rules = [
-        {
-            "event_name": "disk_usage_percent",
-            "max_age_days": config.get('retention_days', 14)
-        },
-        {
-            "event_name": "disk_usage_used_mb",
-            "max_age_days": config.get('retention_days', 14)
-        },
-        {
-            "event_name": "disk_usage_free_mb",
-            "max_age_days": config.get('retention_days', 14)
-        }
-    ]
-    return rules
+    return retention_rules.build_retention_rules(_EVENT_NAMES, config.get('retention_days', 14))
@@ -15,11 +15,29 @@ def init():
 
 last_val = 50
 
+# random draws are batched: a dedicated Random instance pre-draws pools of
+# deltas and tags with choices(), and collect() just advances an index -
+# much cheaper than two random.randint calls per invocation
+_rng = random.Random()
+_POOL_SIZE = 4096
+_delta_pool: List[int] = []
+_tag_pool: List[str] = []
+_pool_index = _POOL_SIZE
+
+
+def _refill_pools():
+    """Pre-draw fresh pools of random deltas and tags."""
+    global _delta_pool, _tag_pool, _pool_index
+    _delta_pool = _rng.choices(range(-5, 6), k=_POOL_SIZE)
+    # keep the original 40/60 type_a/type_b split (randint(1, 10) < 5)
+    _tag_pool = _rng.choices(("type_a", "type_b"), cum_weights=(4, 10), k=_POOL_SIZE)
+    _pool_index = 0
+
 
 def collect(config: Dict[str, Any], persistent_state: object, last_execution_time: datetime) -> List[Dict[str, Any]]:
     """
     Collect data from the data source.
-    
+
     Args:
         config (Dict[str, Any]): Configuration dictionary for the data collector
         persistent_state (object): Persistent state object to store collector state between runs and server executions
@@ -31,19 +49,24 @@ def collect(config: Dict[str, Any], persistent_state: object, last_execution_tim
 
     # generate some random events
     events = []
-    global last_val
+    global last_val, _pool_index
+
+    # refill the pre-drawn random pools when exhausted
+    if _pool_index >= _POOL_SIZE:
+        _refill_pools()
 
     # create event to return
     event = {
-        "name": f"example_event",                                   # event name
-        "value": last_val,                                          # set value based on last value with some random variation
-        "tag": "type_a" if random.randint(1, 10) < 5 else "type_b", # random tag
-        "timestamp": datetime.now()                                 # not mandatory, if None, current time will be used
+        "name": f"example_event",            # event name
+        "value": last_val,                   # set value based on last value with some random variation
+        "tag": _tag_pool[_pool_index],       # random tag
+        "timestamp": datetime.now()          # not mandatory, if None, current time will be used
     }
     events.append(event)
 
     # update last_val for next iteration
-    last_val += random.randint(-5, 5)
+    last_val += _delta_pool[_pool_index]
+    _pool_index += 1
     if last_val < 0:
         last_val = 0
     if last_val > 100:
@@ -1,26 +1,91 @@
 """
 Collect data about io operations per second.
 """
-from typing import Dict, List, Any
+import os
+import sys
+import time
+from typing import Dict, List, Any, Tuple
 from datetime import datetime
+import retention_rules
 
 error_message = None
 
 try:
     import psutil
+    import psutil_cache
 except ModuleNotFoundError:
     error_message = "psutil module must be installed to use io operations collector!"
     psutil = None
 
+# on Linux we read /proc/diskstats directly - much cheaper than psutil's
+# per-device namedtuple construction, and works even without psutil installed
+_use_proc_diskstats = sys.platform.startswith('linux') and os.path.exists('/proc/diskstats')
+if _use_proc_diskstats:
+    error_message = None
+
+_SECTOR_SIZE = 512
 
 _last_values = None # type: ignore
 
+# monotonic nanosecond stamp of the previous sample - immune to wall-clock jumps
+_last_sample_ns = 0
+
+# cached fd for /proc/diskstats and set of whole-disk device names (partitions excluded)
+_diskstats_fd = None
+_block_devices = None
+
+
+# event names emitted by this collector
+_EVENT_NAMES = ("io_operations_read_count_per_sec", "io_operations_write_count_per_sec", "io_operations_read_bytes_per_sec", "io_operations_write_bytes_per_sec")
+
+
+def _read_proc_diskstats() -> Tuple[int, int, int, int]:
+    """
+    Read io counter totals directly from /proc/diskstats.
+    Only whole-disk devices (as listed in /sys/block) are summed, so partitions
+    aren't double counted.
+
+    Returns:
+        Tuple[int, int, int, int]: (read_count, write_count, read_bytes, write_bytes)
+    """
+    global _diskstats_fd, _block_devices
+    if _diskstats_fd is None:
+        _diskstats_fd = os.open('/proc/diskstats', os.O_RDONLY)
+        _block_devices = {name.encode() for name in os.listdir('/sys/block')}
+
+    buf = os.pread(_diskstats_fd, 65536, 0)
+    reads = writes = read_sectors = write_sectors = 0
+    for line in buf.splitlines():
+        fields = line.split()
+        if fields[2] not in _block_devices:
+            continue
+        reads += int(fields[3])
+        read_sectors += int(fields[5])
+        writes += int(fields[7])
+        write_sectors += int(fields[9])
+
+    return (reads, writes, read_sectors * _SECTOR_SIZE, write_sectors * _SECTOR_SIZE)
+
+
+def _read_io_counters() -> Tuple[int, int, int, int]:
+    """
+    Get system-wide io counter totals.
+
+    Returns:
+        Tuple[int, int, int, int]: (read_count, write_count, read_bytes, write_bytes)
+    """
+    if _use_proc_diskstats:
+        return _read_proc_diskstats()
+    io = psutil_cache.get_disk_io_counters()
+    return (io.read_count, io.write_count, io.read_bytes, io.write_bytes)
+
 
 def init():
     """Initialize the data collector."""
-    global _last_values
-    if psutil is not None:
-        _last_values = psutil.disk_io_counters()
+    global _last_values, _last_sample_ns
+    if psutil is not None or _use_proc_diskstats:
+        _last_values = _read_io_counters()
+        _last_sample_ns = time.monotonic_ns()
 
 
 def collect(config: Dict[str, Any], persistent_state: object, last_execution_time: datetime) -> List[Dict[str, Any]]:
@@ -35,26 +100,28 @@ def collect(config: Dict[str, Any], persistent_state: object, last_execution_tim
     Returns:
         List[Dict[str, Any]]: List of event dictionaries collected from the data source
     """
-    if psutil is None:
+    if psutil is None and not _use_proc_diskstats:
         return []
-    
-    global _last_values
 
-    # Get measurement interval
-    interval = (datetime.now() - last_execution_time).total_seconds()
-    
+    global _last_values, _last_sample_ns
+
+    # Get measurement interval from the monotonic clock (integer math, no datetime objects)
+    now_ns = time.monotonic_ns()
+    interval_ns = now_ns - _last_sample_ns or 1
+
     # Take first measurement
     io1 = _last_values
-    io2 = psutil.disk_io_counters()
-    
+    io2 = _read_io_counters()
+
     # Calculate per-second rates
-    reads_per_sec = (io2.read_count - io1.read_count) / interval # type: ignore
-    writes_per_sec = (io2.write_count - io1.write_count) / interval # type: ignore
-    read_bytes_per_sec = (io2.read_bytes - io1.read_bytes) / interval # type: ignore
-    write_bytes_per_sec = (io2.write_bytes - io1.write_bytes) / interval # type: ignore
-    
+    reads_per_sec = (io2[0] - io1[0]) * 1_000_000_000 // interval_ns # type: ignore
+    writes_per_sec = (io2[1] - io1[1]) * 1_000_000_000 // interval_ns # type: ignore
+    read_bytes_per_sec = (io2[2] - io1[2]) * 1_000_000_000 // interval_ns # type: ignore
+    write_bytes_per_sec = (io2[3] - io1[3]) * 1_000_000_000 // interval_ns # type: ignore
+
     # Update last values and time
     _last_values = io2
+    _last_sample_ns = now_ns
 
     return [{
         "name": "io_operations_read_count_per_sec",
@@ -84,22 +151,4 @@ def get_retention_rules(config: Dict[str, Any]) -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]): List of retention rule dictionaries
     """
-    rules = [
-        {
-            "event_name": "io_operations_read_count_per_sec",
-            "max_age_days": config.get('retention_days', 7)
-        },
-        {
-            "event_name": "io_operations_write_count_per_sec",
-            "max_age_days": config.get('retention_days', 7)
-        },
-        {
-            "event_name": "io_operations_read_bytes_per_sec",
-            "max_age_days": config.get('retention_days', 7)
-        },
-        {
-            "event_name": "io_operations_write_bytes_per_sec",
-            "max_age_days": config.get('retention_days', 7)
-        }
-    ]
-    return rules
\ No newline at end of file
+    return retention_rules.build_retention_rules(_EVENT_NAMES, config.get('retention_days', 7))
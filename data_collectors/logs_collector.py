@@ -7,15 +7,100 @@ Created: 2025.
 """
 import re
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Callable, Optional, List, Dict, Any, Tuple
 import logger
 from persistent_state import PersistentState
 
 log = logger.get_logger(__name__)
 
+# optional linear-time regex engine - used when installed, stdlib re otherwise
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
 error_message = None
 
+# max bytes to read from a log file per poll, to cap memory usage on huge backlogs
+_MAX_READ_BYTES = 16 * 1024 * 1024
+
+# sentinel "no previous state" timestamp - identity-comparable, so the per-line
+# newness check can be skipped entirely on a first run
+_EPOCH = datetime(1970, 1, 1)
+
+# map common severity spellings to a single interned uppercase string, so the
+# per-line path reuses one object instead of allocating a new str per line
+_LEVELS: Dict[str, str] = {}
+for _level in ('DEBUG', 'INFO', 'WARNING', 'WARN', 'ERROR', 'CRITICAL', 'FATAL', 'TRACE', 'NOTICE'):
+    _interned_level = sys.intern(_level)
+    for _spelling in (_level, _level.lower(), _level.title()):
+        _LEVELS[_spelling] = _interned_level
+del _level, _interned_level, _spelling
+
+
+class LogParseError(Exception):
+    """
+    Raised when a log file can't be read or its state can't be handled.
+    Helpers raise this instead of mutating the module-level error_message
+    global - collect() is the single place that writes the global.
+    """
+    pass
+
+
+class ParsedBatch:
+    """
+    Struct-of-arrays container for parsed log lines.
+    Parallel lists avoid allocating a dict per parsed line; event dicts are only
+    materialized lazily at the API boundary via iter_events().
+    """
+    __slots__ = ("timestamps", "severities", "messages", "values", "timestamp_strs")
+
+    def __init__(self) -> None:
+        self.timestamps: List[datetime] = []
+        self.severities: List[str] = []
+        self.messages: List[str] = []
+        self.values: List[int] = []
+        self.timestamp_strs: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, timestamp: datetime, severity: str, message: str, value: int,
+               timestamp_str: Optional[str] = None) -> None:
+        """Append one parsed log line to the batch. timestamp_str, when given,
+        is the raw already-ISO string from the log, reused on emission instead
+        of rebuilding it with isoformat()."""
+        self.timestamps.append(timestamp)
+        self.severities.append(severity)
+        self.messages.append(message)
+        self.values.append(value)
+        self.timestamp_strs.append(timestamp_str)
+
+    def iter_events(self, event_name: str):
+        """
+        Lazily yield event dicts for the data collection system.
+
+        Args:
+            event_name (str): Event name to set on generated events
+
+        Yields:
+            Dict[str, Any]: Event data for each parsed log line
+        """
+        for timestamp, severity, message, value, timestamp_str in zip(
+                self.timestamps, self.severities, self.messages, self.values, self.timestamp_strs):
+            yield {
+                'name': event_name,
+                'value': value,
+                'timestamp': timestamp_str if timestamp_str is not None else timestamp.isoformat(),
+                'tag': severity,
+                'additional_info': message
+            }
+
 # Example log patterns that can be used in configuration:
 # Pattern 1: "2025-10-27 14:30:25 ERROR Message here"
 # r'^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}(?:\.\d+)?)\s+(\w+)\s+(.+)$'
@@ -40,8 +125,9 @@ error_message = None
 # '%Y/%m/%d %H:%M:%S.%f'
 
 # Configuration Options:
-# - log_file_path: Path to the log file to monitor (required)
-# - log_pattern: Regex pattern for parsing log lines (required) 
+# - log_file_path: Path to the log file to monitor (required unless log_files is set)
+# - log_files: Optional list of log file paths to monitor in parallel
+# - log_pattern: Regex pattern for parsing log lines - string or precompiled re.Pattern (required)
 # - timestamp_format: Format for parsing timestamps (required)
 # - timestamp_group_index: Regex group index for timestamp (default: 1)
 # - severity_group_index: Regex group index for severity (default: 2)
@@ -83,68 +169,148 @@ def collect(config: Dict[str, Any], persistent_state: PersistentState, last_exec
     """
     global error_message
     events = []
-    
+
     try:
-        # Get configuration
-        log_file_path = config.get('log_file_path')
-        if not log_file_path:
-            error_message = "log_file_path not specified in collector configuration"
-            return events
-        
+        # Get configured log files - either a list or a single path
+        log_files = config.get('log_files')
+        if not log_files:
+            log_file_path = config.get('log_file_path')
+            if not log_file_path:
+                error_message = "log_file_path not specified in collector configuration"
+                return events
+            log_files = [log_file_path]
+
         timestamp_format = config.get('timestamp_format')
         log_pattern = config.get('log_pattern')
-        
+
         # Validate required configuration
         if not log_pattern:
             error_message = "log_pattern not specified in collector configuration"
             return events
-        
+
         if not timestamp_format:
             error_message = "timestamp_format not specified in collector configuration"
             return events
-        
-        # Check if log file exists
-        if not os.path.exists(log_file_path):
-            error_message = f"Log file not found: {log_file_path}"
-            return events
-        
-        # Get state key for this log file
-        state_key = f"log_collector_{os.path.basename(log_file_path)}"
-        
-        # Get last processed timestamp from persistent state
-        last_timestamp = _get_last_timestamp(persistent_state, state_key)
-        log.debug(f"Last processed timestamp for {log_file_path}: {last_timestamp}")
-        
-        # Read and parse log file
-        new_lines = _read_new_log_lines(log_file_path, last_timestamp, config)
-        
-        # Process each new line
-        latest_timestamp = last_timestamp
-        for line_data in new_lines:
-            try:
-                event = _create_event_from_log_line(line_data, config)
-                if event:
-                    events.append(event)
-                    # Track the latest timestamp
-                    if line_data['timestamp'] > latest_timestamp:
-                        latest_timestamp = line_data['timestamp']
-                        
-            except Exception as e:
-                error_message = f"Failed to process log line: {line_data.get('raw_line', 'N/A')} - {e}"
-        
-        # Update last processed timestamp
-        if latest_timestamp > last_timestamp:
-            _save_last_timestamp(persistent_state, state_key, latest_timestamp, log_file_path)
-            log.debug(f"Updated last processed timestamp to: {latest_timestamp}")
-        
-        log.info(f"Collected {len(events)} new log entries from {log_file_path}")
-        
+
+        # One-time sanity check for pattern shapes that backtrack badly
+        _validate_log_pattern(log_pattern)
+
+        # Single file: collect inline, no executor overhead.
+        # Multiple files: fan out across the thread pool so disk waits overlap
+        if len(log_files) == 1:
+            events.extend(_collect_file(log_files[0], config, persistent_state))
+        else:
+            futures = [_get_executor().submit(_collect_file, log_file_path, config, persistent_state)
+                       for log_file_path in log_files]
+            # harvest every future before raising - the workers already advanced
+            # their saved offsets, so dropping a good file's result here would
+            # lose its lines for good
+            first_error = None
+            for future in futures:
+                try:
+                    events.extend(future.result())
+                except Exception as e:
+                    if first_error is None:
+                        first_error = e
+            if first_error is not None:
+                raise first_error
+
+        log.info("Collected %d new log entries from %d log file(s)", len(events), len(log_files))
+
         # Set error_message to None after successful collection
         error_message = None
-        
+
+    except LogParseError as e:
+        error_message = str(e)
     except Exception as e:
         error_message = f"Error collecting log data: {e}"
-    
+
+    return events
+
+
+# shared executor for multi-file collection, created lazily on first use
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool used to parse multiple log files in parallel.
+
+    Returns:
+        ThreadPoolExecutor: Shared executor
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=min(8, 2 * (os.cpu_count() or 1)),
+                                       thread_name_prefix='logs_collector')
+    return _executor
+
+
+def _collect_file(log_file_path: str, config: Dict[str, Any], persistent_state: PersistentState) -> List[Dict[str, Any]]:
+    """
+    Collect new log entries from a single log file.
+
+    Args:
+        log_file_path (str): Path to the log file
+        config (Dict[str, Any]): Collector configuration
+        persistent_state (object): Persistent state object for tracking last read position
+
+    Returns:
+        List[Dict[str, Any]]: List of events representing new log entries
+
+    Raises:
+        LogParseError: If the log file is missing or can't be read
+    """
+    # Stat the file once - used for existence, the unchanged short-circuit,
+    # and the resume offset below
+    try:
+        file_stat = os.stat(log_file_path)
+    except FileNotFoundError:
+        raise LogParseError(f"Log file not found: {log_file_path}")
+
+    # Key state by the full path - two monitored files sharing a basename must
+    # not collide on one state entry. State saved under the legacy basename key
+    # is migrated once, but only if it was written for this exact path
+    state_key = f"log_collector_{log_file_path}"
+    if persistent_state.get(state_key) is None:
+        legacy_key = f"log_collector_{os.path.basename(log_file_path)}"
+        legacy_state = persistent_state.get(legacy_key)
+        if legacy_state and legacy_state.get('log_file_path') == log_file_path:
+            persistent_state.set(state_key, legacy_state)
+            persistent_state.delete(legacy_key)
+
+    # If the file wasn't touched since the last fully-consumed poll, that one
+    # stat call replaces the whole open/read/parse cycle
+    state_data = persistent_state.get(state_key)
+    if state_data and state_data.get('inode') == file_stat.st_ino \
+            and state_data.get('size') == file_stat.st_size \
+            and state_data.get('offset') == state_data.get('size') \
+            and state_data.get('mtime_ns') is not None \
+            and file_stat.st_mtime_ns <= state_data['mtime_ns']:
+        log.debug("Log file %s unchanged since last poll, skipping read", log_file_path)
+        return []
+
+    # Get last processed timestamp from persistent state
+    last_timestamp = _get_last_timestamp(persistent_state, state_key)
+    log.debug("Last processed timestamp for %s: %s", log_file_path, last_timestamp)
+
+    # Read and parse the new log file tail (incremental, from the saved byte offset)
+    batch, end_offset, file_inode, skip_until_done = _read_new_log_lines(log_file_path, file_stat, last_timestamp, config, persistent_state, state_key)
+
+    # Materialize events from the parsed batch
+    events = list(batch.iter_events(config.get('event_name', 'log_message')))
+
+    # Track the latest parsed timestamp - max() runs the scan in C, and never
+    # let it move backwards past what we already saved
+    latest_timestamp = max(batch.timestamps, default=last_timestamp)
+    if latest_timestamp < last_timestamp:
+        latest_timestamp = last_timestamp
+
+    # Update last processed timestamp and file read position
+    _save_last_timestamp(persistent_state, state_key, latest_timestamp, log_file_path, end_offset, file_inode,
+                         file_stat.st_mtime_ns, file_stat.st_size, skip_until_done)
+    log.debug("Updated last processed timestamp to: %s (offset %d)", latest_timestamp, end_offset)
+
     return events
 
 
@@ -180,156 +346,611 @@ def _get_last_timestamp(persistent_state: PersistentState, state_key: str) -> da
     Returns:
         datetime: Last processed timestamp, or epoch if not found
     """
-    global error_message
     try:
         state_data = persistent_state.get(state_key)
         if state_data and 'last_timestamp' in state_data:
             return datetime.fromisoformat(state_data['last_timestamp'])
     except Exception as e:
-        error_message = f"Failed to get last timestamp from state: {e}"
-    
+        log.debug("Failed to get last timestamp from state: %s", e)
+
     # Return epoch time if no previous state
-    return datetime(1970, 1, 1)
+    return _EPOCH
 
 
-def _save_last_timestamp(persistent_state: PersistentState, state_key: str, timestamp: datetime, log_file_path: str) -> None:
+def _save_last_timestamp(persistent_state: PersistentState, state_key: str, timestamp: datetime, log_file_path: str,
+                         offset: Optional[int] = None, inode: Optional[int] = None,
+                         mtime_ns: Optional[int] = None, size: Optional[int] = None,
+                         skip_until_done: bool = True) -> None:
     """
-    Save the last processed timestamp to persistent state.
-    
+    Save the last processed timestamp and file read position to persistent state.
+
     Args:
         persistent_state (object): Persistent state object
         state_key (str): State key for this log file
         timestamp (datetime): Timestamp to save
         log_file_path (str): Path to the log file
+        offset (Optional[int]): Byte offset we consumed the file up to
+        inode (Optional[int]): File inode, used to detect rotation
+        mtime_ns (Optional[int]): File modification time in ns, for the unchanged short-circuit
+        size (Optional[int]): File size in bytes when we read it
+        skip_until_done (bool): Whether the skip_until marker was already consumed
     """
-    global error_message
-    try:
-        state_data = {
-            'last_timestamp': timestamp.isoformat(),
-            'log_file_path': log_file_path
-        }
-        persistent_state.set(state_key, state_data)
-    except Exception as e:
-        error_message = f"Failed to save last timestamp to state: {e}"
+    state_data = {
+        'last_timestamp': timestamp.isoformat(),
+        'log_file_path': log_file_path,
+        'offset': offset,
+        'inode': inode,
+        'mtime_ns': mtime_ns,
+        'size': size,
+        'skip_until_done': skip_until_done
+    }
+    persistent_state.set(state_key, state_data)
 
 
-def _read_new_log_lines(log_file_path: str, last_timestamp: datetime, 
-                       config: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _get_saved_offset(persistent_state: PersistentState, state_key: str, file_stat: os.stat_result) -> int:
     """
-    Read new log lines from the file that are newer than the last timestamp.
-    
+    Get the byte offset to resume reading the log file from.
+    Returns 0 if there is no saved offset or the file was rotated/truncated.
+
+    Args:
+        persistent_state (object): Persistent state object
+        state_key (str): State key for this log file
+        file_stat (os.stat_result): Current stat of the log file
+
+    Returns:
+        int: Byte offset to seek to before reading
+    """
+    state_data = persistent_state.get(state_key)
+    if not state_data:
+        return 0
+
+    offset = state_data.get('offset') or 0
+
+    # rotated (different inode) or truncated (shrunk below our offset)? start over
+    if state_data.get('inode') != file_stat.st_ino or file_stat.st_size < offset:
+        return 0
+
+    return offset
+
+
+def _read_new_log_lines(log_file_path: str, file_stat: os.stat_result, last_timestamp: datetime,
+                       config: Dict[str, Any], persistent_state: PersistentState,
+                       state_key: str) -> "Tuple[ParsedBatch, int, int, bool]":
+    """
+    Read new log lines from the file, resuming from the saved byte offset.
+    Only the tail written since the previous collect is read and parsed; the whole
+    file is re-read only on the first run or after rotation/truncation.
+
     Args:
         log_file_path (str): Path to the log file
-        last_timestamp (datetime): Only process lines newer than this
+        file_stat (os.stat_result): Current stat of the log file
+        last_timestamp (datetime): Only process lines newer than this (first run / rotation only)
         config (Dict[str, Any]): Configuration containing filtering and parsing options
-        
+        persistent_state (object): Persistent state object with the saved read position
+        state_key (str): State key for this log file
+
     Returns:
-        List[Dict[str, Any]]: List of parsed log line data
+        Tuple[ParsedBatch, int, int, bool]: Parsed log lines batch, byte offset
+            consumed up to, the file inode, and whether the skip_until marker was
+            already consumed (always True when skip_until isn't configured)
+
+    Raises:
+        LogParseError: If the log file can't be read
     """
-    global error_message
-    new_lines = []
-    
+    batch = ParsedBatch()
+
     # Get filtering options from config
     include_regex = config.get('include_regex')
     exclude_regex = config.get('exclude_regex')
     skip_until = config.get('skip_until')
     
-    # Compile regex patterns if provided
-    include_pattern = re.compile(include_regex) if include_regex else None
-    exclude_pattern = re.compile(exclude_regex) if exclude_regex else None
-    skip_until_pattern = re.compile(skip_until) if skip_until else None
+    # Get compiled patterns if provided (cached across polls)
+    include_pattern = _compile_pattern(include_regex) if include_regex else None
+    exclude_pattern = _compile_pattern(exclude_regex) if exclude_regex else None
+    skip_until_pattern = _compile_pattern(skip_until) if skip_until else None
     
     # Track whether we should skip lines (for skip_until functionality)
     skipping_lines = skip_until is not None
-    
+
     try:
-        with open(log_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Handle skip_until logic
-                if skipping_lines and skip_until_pattern:
-                    if skip_until_pattern.search(line):
-                        skipping_lines = False  # Stop skipping from this line onwards
-                        log.debug(f"Skip_until pattern matched at line {line_num}, resuming processing")
-                    else:
-                        continue  # Skip this line
-                
-                # Apply include filter (if line doesn't match, skip it)
-                if include_pattern and not include_pattern.search(line):
-                    continue
-                
-                # Apply exclude filter (if line matches, skip it)  
-                if exclude_pattern and exclude_pattern.search(line):
-                    continue
-                
-                # Parse the log line
-                parsed_line = _parse_log_line(line, line_num, config)
-                
-                if parsed_line and parsed_line['timestamp'] > last_timestamp:
-                    new_lines.append(parsed_line)
-                    
+        # Figure out where to resume reading from (0 on first run / rotation)
+        start_offset = _get_saved_offset(persistent_state, state_key, file_stat)
+
+        # skip_until is satisfied once per file: after the marker line has been
+        # consumed, later polls read a tail that no longer contains it, so the
+        # persisted flag decides instead of re-matching. A zero offset means a
+        # first run or a rotated file - there the marker must be found again
+        if skipping_lines and start_offset > 0:
+            state_data = persistent_state.get(state_key)
+            if state_data and state_data.get('skip_until_done'):
+                skipping_lines = False
+                skip_until_pattern = None
+
+        # When resuming from a saved offset, the file position alone guarantees newness;
+        # the per-line timestamp filter is only needed when re-reading from the start
+        # with real previous state - on a first run (epoch sentinel) every parsed line
+        # is newer by definition, so skip the datetime compare in the hot loop too
+        check_timestamp = (start_offset == 0 and last_timestamp is not _EPOCH)
+
+        # Read the new tail in one go so the parsing loop works on a single buffer.
+        # Binary mode + one decode avoids the per-line incremental decoder, and the
+        # read cap bounds memory - leftovers are picked up on the next poll
+        with open(log_file_path, 'rb') as f:
+            if start_offset:
+                f.seek(start_offset)
+            data = f.read(_MAX_READ_BYTES)
+            end_offset = f.tell()
+
+        # if we hit the read cap mid-line, trim back to the last complete line
+        if len(data) == _MAX_READ_BYTES:
+            cut = data.rfind(b'\n')
+            if cut != -1:
+                end_offset -= len(data) - (cut + 1)
+                data = data[:cut + 1]
+
+        content = data.decode('utf-8', 'ignore')
+
+        log_pattern = config.get('log_pattern')
+
+        # Fastest path: simple "TIMESTAMP LEVEL MESSAGE" shapes skip the regex engine entirely.
+        # The loop body is kept minimal - no enumerate/strip per line, config lookups hoisted -
+        # so the bulk of the work stays in str.split's C implementation
+        if log_pattern is not None and not (include_pattern or exclude_pattern or skip_until_pattern) \
+                and _is_split_parsable(log_pattern, config):
+            timestamp_format = config.get('timestamp_format')
+            for line in content.split('\n'):
+                parsed_line = _parse_log_line_split(line, timestamp_format)
+                if parsed_line and (not check_timestamp or parsed_line[0] > last_timestamp):
+                    batch.append(*parsed_line)
+            return batch, end_offset, file_stat.st_ino, not skipping_lines
+
+        # Fast path: no skip_until configured - run one multiline regex scan over
+        # the whole buffer, keeping the matching loop in C instead of Python.
+        # include/exclude filters, when set, run on the matched lines only
+        if log_pattern is not None and skip_until_pattern is None:
+            try:
+                multiline_pattern = _compile_multiline_pattern(log_pattern)
+            except re.error:
+                # anchored form doesn't compile - the per-line path below
+                # matches the pattern as-is, same as the pre-finditer behavior
+                multiline_pattern = None
+        else:
+            multiline_pattern = None
+
+        if multiline_pattern is not None:
+            parse_match = _get_match_parser(config)
+            include_literal = _literal_prefilter(include_regex) if include_regex else None
+            exclude_literal = _literal_prefilter(exclude_regex) if exclude_regex else None
+            for match in multiline_pattern.finditer(content):
+                if include_pattern or exclude_pattern:
+                    # filter against the full physical line - the match may stop
+                    # before the end of it when the pattern doesn't span to EOL
+                    line_end = content.find('\n', match.end())
+                    line = content[match.start():line_end if line_end != -1 else len(content)]
+                    if include_pattern and ((include_literal is not None and include_literal not in line)
+                                            or not include_pattern.search(line)):
+                        continue
+                    if exclude_pattern and (exclude_literal is None or exclude_literal in line) \
+                            and exclude_pattern.search(line):
+                        continue
+                parsed_line = parse_match(match)
+                if parsed_line and (not check_timestamp or parsed_line[0] > last_timestamp):
+                    batch.append(*parsed_line)
+            return batch, end_offset, file_stat.st_ino, not skipping_lines
+
+        # Filtered path: process line by line
+        line_pattern = _compile_pattern(log_pattern) if log_pattern else None
+        parse_match = _get_match_parser(config)
+
+        # literal substrings extracted from the filter patterns - a cheap
+        # `in line` test lets most lines skip the regex engine entirely
+        include_literal = _literal_prefilter(include_regex) if include_regex else None
+        exclude_literal = _literal_prefilter(exclude_regex) if exclude_regex else None
+        skip_until_literal = _literal_prefilter(skip_until) if skip_until else None
+
+        unparsed_count = 0
+        for line_num, line in enumerate(content.splitlines(), 1):
+            # no per-line strip - splitlines already dropped the terminators, and
+            # search/match below don't care about surrounding whitespace
+            if not line:
+                continue
+
+            # Handle skip_until logic
+            if skipping_lines and skip_until_pattern:
+                if (skip_until_literal is None or skip_until_literal in line) and skip_until_pattern.search(line):
+                    skipping_lines = False  # Stop skipping from this line onwards
+                    log.debug(f"Skip_until pattern matched at line {line_num}, resuming processing")
+                else:
+                    continue  # Skip this line
+
+            # Apply include filter (if line doesn't match, skip it)
+            if include_pattern and ((include_literal is not None and include_literal not in line)
+                                    or not include_pattern.search(line)):
+                continue
+
+            # Apply exclude filter (if line matches, skip it)
+            if exclude_pattern and (exclude_literal is None or exclude_literal in line) \
+                    and exclude_pattern.search(line):
+                continue
+
+            # Parse the log line (retry stripped only for the rare indented line)
+            match = line_pattern.match(line) if line_pattern else None
+            if match is None and line_pattern is not None and line[0].isspace():
+                match = line_pattern.match(line.strip())
+            parsed_line = parse_match(match) if match else None
+
+            if parsed_line:
+                if not check_timestamp or parsed_line[0] > last_timestamp:
+                    batch.append(*parsed_line)
+            else:
+                unparsed_count += 1
+
+        if unparsed_count:
+            log.debug("Could not parse %d line(s) from %s", unparsed_count, log_file_path)
+
+        return batch, end_offset, file_stat.st_ino, not skipping_lines
+
+    except LogParseError:
+        raise
     except Exception as e:
-        error_message = f"Failed to read log file {log_file_path}: {e}"
-    
-    return new_lines
+        raise LogParseError(f"Failed to read log file {log_file_path}: {e}") from e
+
+
+# patterns with the simple "TIMESTAMP LEVEL MESSAGE" shape (patterns 1 and 5 above)
+# can be parsed with str.split instead of the regex engine - one C call per line
+_SPLIT_FAST_PATH_PATTERNS = {
+    r'^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}(?:\.\d+)?)\s+(\w+)\s+(.+)$',
+    r'^(\S+\s+\S+)\s+(\w+)\s+(.+)$',
+}
 
 
-def _parse_log_line(line: str, line_num: int, 
-                   config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def _is_split_parsable(log_pattern, config: Dict[str, Any]) -> bool:
     """
-    Parse a single log line to extract timestamp, severity, and message.
-    
+    Check if the configured pattern can use the whitespace-split fast path.
+
+    Args:
+        log_pattern (Union[str, re.Pattern]): Configured log pattern
+        config (Dict[str, Any]): Collector configuration
+
+    Returns:
+        bool: True if lines can be parsed with str.split instead of the regex engine
+    """
+    pattern_str = log_pattern.pattern if isinstance(log_pattern, re.Pattern) else log_pattern
+    if pattern_str not in _SPLIT_FAST_PATH_PATTERNS:
+        return False
+
+    # split parsing assumes the default timestamp/severity/content group layout
+    return (config.get('timestamp_group_index', 1) == 1 and
+            config.get('severity_group_index', 2) == 2 and
+            config.get('content_group_index', 3) == 3 and
+            config.get('value_group_index') is None)
+
+
+def _parse_log_line_split(line: str, timestamp_format: str) -> Optional[Tuple[datetime, str, str, int, Optional[str]]]:
+    """
+    Parse a "TIMESTAMP LEVEL MESSAGE" log line with str.split instead of the regex engine.
+    Only valid for patterns accepted by _is_split_parsable.
+
     Args:
         line (str): Raw log line
-        line_num (int): Line number in file
-        config (Dict[str, Any]): Configuration containing parsing options
-        
+        timestamp_format (str): Configured timestamp format
+
     Returns:
-        Optional[Dict[str, Any]]: Parsed line data or None if parsing failed
+        Optional[Tuple[datetime, str, str, int, Optional[str]]]: (timestamp, severity,
+            message, value, raw timestamp string) or None if parsing failed
     """
-    log_pattern = config.get('log_pattern')
-    timestamp_format = config.get('timestamp_format')
-    
-    # Validate required config values
-    if not log_pattern or not timestamp_format:
+    # timestamp is two whitespace-separated tokens (date + time), then level, then message
+    parts = line.split(None, 3)
+    if len(parts) < 4:
         return None
-    
-    # Get configurable group indices (defaults to 1, 2, 3)
-    timestamp_group_index = config.get('timestamp_group_index', 1)
-    severity_group_index = config.get('severity_group_index', 2)
-    content_group_index = config.get('content_group_index', 3)
-    value_group_index = config.get('value_group_index', None)
-    
-    # Use the single pattern from config
-    match = re.match(log_pattern, line)
-    if match:
+
+    timestamp_str = parts[0] + ' ' + parts[1]
+
+    # reuse the raw string on emission with comma fraction separators normalized
+    # to dots - the same rule as the regex path, so both paths emit the log's
+    # own "YYYY-MM-DD HH:MM:SS[.fff]" shape instead of isoformat()'s 'T' form
+    raw_timestamp = None
+    timestamp = None
+    if timestamp_format in _ISO_TIMESTAMP_FORMATS:
+        try:
+            raw_timestamp = timestamp_str.replace(',', '.')
+            timestamp = datetime.fromisoformat(raw_timestamp)
+        except ValueError:
+            raw_timestamp = None
+    if timestamp is None:
+        timestamp = _parse_timestamp(timestamp_str, timestamp_format)
+    if not timestamp:
+        return None
+
+    severity = parts[2]
+    return (timestamp, _LEVELS.get(severity) or severity.upper(), parts[3].strip(), 1, raw_timestamp)
+
+
+# compiled pattern cache keyed by pattern string - survives across collect() calls,
+# avoiding the re module's internal cache probe on every parsed line
+_compiled_patterns: Dict[str, "re.Pattern"] = {}
+
+
+# regex metacharacters - a literal run in a pattern ends at any of these
+_RE_METACHARS = frozenset('.^$*+?{}[]|()\\')
+
+
+@lru_cache(maxsize=128)
+def _literal_prefilter(pattern_str: str) -> Optional[str]:
+    """
+    Extract the longest literal substring that any match of the pattern must
+    contain, so the per-line loop can do a cheap `substring in line` test
+    before invoking the regex engine.
+
+    Args:
+        pattern_str (str): Regex pattern string
+
+    Returns:
+        Optional[str]: Literal substring, or None if no useful literal exists
+    """
+    if not isinstance(pattern_str, str):
+        return None
+
+    # inline flags (e.g. case-insensitivity) break the plain substring test
+    if pattern_str.startswith('(?'):
+        return None
+
+    best = ''
+    current = ''
+    i = 0
+    n = len(pattern_str)
+    # parenthesis nesting depth - literals inside a group may be alternated,
+    # made optional by a quantifier on the group, or sit in a lookaround, so
+    # only runs found at the top level are trusted as required
+    depth = 0
+    while i < n:
+        char = pattern_str[i]
+        if char == '\\':
+            if depth == 0 and i + 1 < n and pattern_str[i + 1] in ' !"#%&\',/:;<=>@_`~-':
+                # escaped punctuation is a literal character
+                current += pattern_str[i + 1]
+                i += 2
+                continue
+            # escape-class shorthands (\d, \w, \b, ...) match variable text - end
+            # the literal run and skip the escaped char so it doesn't leak into
+            # the literal as a plain character
+            if len(current) > len(best):
+                best = current
+            current = ''
+            i += 2
+            continue
+        if char == '[':
+            # character classes match variable text - skip their contents so
+            # they don't leak into the literal (']', '|' and '(' are plain
+            # characters inside a class)
+            if len(current) > len(best):
+                best = current
+            current = ''
+            i += 1
+            if i < n and pattern_str[i] == '^':
+                i += 1
+            if i < n and pattern_str[i] == ']':
+                i += 1
+            while i < n and pattern_str[i] != ']':
+                i += 2 if pattern_str[i] == '\\' else 1
+            i += 1
+            continue
+        if char == '{':
+            # repetition spec - drop the now-repeated preceding char and skip
+            # the braces so the counts aren't taken as literal text
+            if current:
+                current = current[:-1]
+            if len(current) > len(best):
+                best = current
+            current = ''
+            while i < n and pattern_str[i] != '}':
+                i += 1
+            i += 1
+            continue
+        if char == '(':
+            depth += 1
+            if len(current) > len(best):
+                best = current
+            current = ''
+            i += 1
+            continue
+        if char == ')':
+            if depth:
+                depth -= 1
+            i += 1
+            continue
+        if char == '|':
+            # a top-level alternation means no single literal is required
+            if depth == 0:
+                return None
+            i += 1
+            continue
+        if depth:
+            # inside a group - ignored, see above
+            i += 1
+            continue
+        if char in _RE_METACHARS:
+            # a quantifier makes the preceding char optional/repeated - drop it
+            if char in '?*' and current:
+                current = current[:-1]
+            if len(current) > len(best):
+                best = current
+            current = ''
+            i += 1
+            continue
+        current += char
+        i += 1
+
+    if len(current) > len(best):
+        best = current
+
+    # short literals match too often to be worth the extra scan
+    return best if len(best) >= 3 else None
+
+
+def _compile_pattern(log_pattern) -> "re.Pattern":
+    """
+    Return the configured log pattern as a compiled re.Pattern (cached by pattern string).
+
+    Args:
+        log_pattern (Union[str, re.Pattern]): Configured log pattern
+
+    Returns:
+        re.Pattern: Compiled pattern
+    """
+    if isinstance(log_pattern, re.Pattern):
+        return log_pattern
+    pattern = _compiled_patterns.get(log_pattern)
+    if pattern is None:
+        pattern = _compiled_patterns[log_pattern] = _compile_with_engine(log_pattern, 0)
+    return pattern
+
+
+@lru_cache(maxsize=128)
+def _compile_with_engine(pattern_str: str, flags: int) -> "re.Pattern":
+    """
+    Compile a pattern with RE2 when it's installed - guaranteed linear-time
+    matching and typically much higher throughput - falling back to stdlib re
+    for patterns RE2 doesn't support (or when it isn't installed).
+
+    Args:
+        pattern_str (str): Regex pattern string
+        flags (int): Regex flags
+
+    Returns:
+        re.Pattern: Compiled pattern (stdlib or RE2, same match/search/finditer API)
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern_str, flags)
+        except Exception as e:
+            log.debug("RE2 can't compile %r (%s), using stdlib re", pattern_str, e)
+    return re.compile(pattern_str, flags)
+
+
+def _compile_multiline_pattern(log_pattern) -> "re.Pattern":
+    """
+    Compile the configured log pattern with re.MULTILINE so it can be scanned
+    over a whole file buffer with finditer (^/$ anchors match per line).
+    A leading ^ is added if missing, matching the anchored-at-line-start
+    semantics the per-line path gets from re.match.
+
+    Args:
+        log_pattern (Union[str, re.Pattern]): Configured log pattern
+
+    Returns:
+        re.Pattern: Compiled multiline pattern
+    """
+    if isinstance(log_pattern, re.Pattern):
+        pattern_str, flags = log_pattern.pattern, log_pattern.flags
+    else:
+        pattern_str, flags = log_pattern, 0
+    # global inline flags like (?i) must stay at the very start of the
+    # expression - splice the anchor in right after them, not before
+    flags_prefix = re.match(r'(?:\(\?[aiLmsux]+\))+', pattern_str)
+    pos = flags_prefix.end() if flags_prefix else 0
+    if not pattern_str.startswith('^', pos):
+        pattern_str = pattern_str[:pos] + '^' + pattern_str[pos:]
+    return _compile_with_engine(pattern_str, flags | re.MULTILINE)
+
+
+# pattern strings already checked by _validate_log_pattern
+_validated_patterns = set()
+
+
+def _validate_log_pattern(log_pattern) -> None:
+    """
+    One-time sanity check on the configured log pattern, warning about shapes
+    known to backtrack heavily on malformed lines.
+
+    Args:
+        log_pattern (Union[str, re.Pattern]): Configured log pattern
+    """
+    pattern_str = log_pattern.pattern if isinstance(log_pattern, re.Pattern) else log_pattern
+    if pattern_str in _validated_patterns:
+        return
+    _validated_patterns.add(pattern_str)
+
+    if pattern_str.count('.*') + pattern_str.count('.+') > 1:
+        log.warning("log_pattern %r contains multiple unbounded wildcards - this can "
+                    "backtrack heavily on lines that almost match; prefer specific "
+                    "character classes (e.g. \\S+ or [^ ]+) for all but the last group",
+                    pattern_str)
+
+
+# specialized match-parser cache, keyed by the parse-relevant config values - the
+# pattern and format are fixed at config time, so the closure is built once
+_match_parsers: Dict[Tuple, Callable[["re.Match"], Optional[Tuple[datetime, str, str, int]]]] = {}
+
+
+def _get_match_parser(config: Dict[str, Any]) -> Callable[["re.Match"], Optional[Tuple[datetime, str, str, int]]]:
+    """
+    Get a parse function specialized for the configured pattern shape (cached).
+
+    Args:
+        config (Dict[str, Any]): Configuration containing parsing options
+
+    Returns:
+        Callable: Function mapping a pattern match to (timestamp, severity, message, value) or None
+    """
+    key = (config.get('timestamp_format'),
+           config.get('timestamp_group_index', 1),
+           config.get('severity_group_index', 2),
+           config.get('content_group_index', 3),
+           config.get('value_group_index'))
+    parser = _match_parsers.get(key)
+    if parser is None:
+        parser = _match_parsers[key] = _build_match_parser(*key)
+    return parser
+
+
+def _build_match_parser(timestamp_format: str, timestamp_group_index: int, severity_group_index: int,
+                        content_group_index: int, value_group_index: Optional[int]):
+    """
+    Build a parse function with the configured group indices and timestamp format
+    bound into the closure, so the per-line call does no config lookups and no
+    format branching - one regex match result in, one tuple out.
+
+    Args:
+        timestamp_format (str): Configured timestamp format
+        timestamp_group_index (int): Regex group index for the timestamp
+        severity_group_index (int): Regex group index for the severity
+        content_group_index (int): Regex group index for the message content
+        value_group_index (Optional[int]): Regex group index for the value, if any
+
+    Returns:
+        Callable: Function mapping a pattern match to (timestamp, severity, message, value) or None
+    """
+    # resolve the timestamp parse strategy once, outside the per-line function
+    iso_fast_path = timestamp_format in _ISO_TIMESTAMP_FORMATS
+    fromisoformat = datetime.fromisoformat
+    levels_get = _LEVELS.get
+
+    def parse_match(match: "re.Match") -> Optional[Tuple[datetime, str, str, int, Optional[str]]]:
         try:
             timestamp_str = match.group(timestamp_group_index)
-            severity = match.group(severity_group_index).upper()
+            raw_timestamp = None
+            if iso_fast_path:
+                try:
+                    raw_timestamp = timestamp_str.replace(',', '.')
+                    timestamp = fromisoformat(raw_timestamp)
+                except ValueError:
+                    raw_timestamp = None
+                    timestamp = _parse_timestamp(timestamp_str, timestamp_format)
+            else:
+                timestamp = _parse_timestamp(timestamp_str, timestamp_format)
+            if timestamp is None:
+                return None
+
+            severity = match.group(severity_group_index)
             message = match.group(content_group_index).strip()
             value = int(match.group(value_group_index).strip()) if value_group_index else 1
-            
-            # Parse timestamp
-            timestamp = _parse_timestamp(timestamp_str, timestamp_format)
-            if timestamp:
-                return {
-                    'timestamp': timestamp,
-                    'severity': severity,
-                    'message': message,
-                    'raw_line': line,
-                    'value': value,
-                    'line_number': line_num
-                }
-            
-        except Exception as e:
-            log.debug(f"Failed to parse line {line_num} with pattern: {e}")
-    
-    # If no pattern matched, log a debug message
-    log.debug(f"Could not parse log line {line_num}: {line[:100]}...")
-    return None
+            return (timestamp, levels_get(severity) or severity.upper(), message, value, raw_timestamp)
+
+        except Exception:
+            return None
+
+    return parse_match
 
 
 def _parse_timestamp(timestamp_str: str, timestamp_format: str) -> Optional[datetime]:
@@ -344,40 +965,75 @@ def _parse_timestamp(timestamp_str: str, timestamp_format: str) -> Optional[date
         Optional[datetime]: Parsed timestamp or None if parsing failed
     """
     try:
+        # Fast path: ISO-like formats parse with the C-implemented fromisoformat,
+        # roughly 10x faster than strptime's format-string interpretation
+        if timestamp_format in _ISO_TIMESTAMP_FORMATS:
+            try:
+                return datetime.fromisoformat(timestamp_str.replace(',', '.'))
+            except ValueError:
+                pass  # fall through to strptime below
+
+        # Slash-date formats are ISO after swapping the separators
+        if timestamp_format in _SLASH_TIMESTAMP_FORMATS:
+            try:
+                return datetime.fromisoformat(timestamp_str.replace('/', '-'))
+            except ValueError:
+                pass  # fall through to strptime below
+
         # Handle special case for syslog format (no year)
         if timestamp_format == '%b %d %H:%M:%S':
-            # Add current year to syslog format
-            current_year = datetime.now().year
-            timestamp_str_with_year = f"{current_year} {timestamp_str}"
-            return datetime.strptime(timestamp_str_with_year, f'%Y %b %d %H:%M:%S')
+            # Add current year to syslog format (cached, not fetched per line)
+            timestamp_str_with_year = f"{_current_year()} {timestamp_str}"
+            return _cached_strptime(timestamp_str_with_year, f'%Y %b %d %H:%M:%S')
         else:
-            return datetime.strptime(timestamp_str, timestamp_format)
-            
+            return _cached_strptime(timestamp_str, timestamp_format)
+
     except ValueError:
         pass
-    
+
     log.debug(f"Could not parse timestamp: {timestamp_str}")
     return None
 
 
-def _create_event_from_log_line(line_data: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+@lru_cache(maxsize=4096)
+def _cached_strptime(timestamp_str: str, timestamp_format: str) -> datetime:
     """
-    Create an event dictionary from parsed log line data.
-    
+    datetime.strptime with a module-level memo - log files emit bursts of lines
+    sharing the same second-resolution timestamp, and a dict lookup on a short
+    string is far cheaper than re-interpreting the format string.
+
     Args:
-        line_data (Dict[str, Any]): Parsed log line data
-        config (Dict[str, Any]): Collector configuration
-        
+        timestamp_str (str): Timestamp string from log
+        timestamp_format (str): Timestamp format from configuration
+
     Returns:
-        Dict[str, Any]: Event data for the data collection system
+        datetime: Parsed timestamp
     """
-    # Get configurable event name, default to 'log_message'
-    event_name = config.get('event_name', 'log_message')
-    
-    return {
-        'name': event_name,
-        'value': line_data['value'],
-        'timestamp': line_data['timestamp'].isoformat(),
-        'tag': line_data['severity'],
-        'additional_info': line_data['message']
-    }
+    return datetime.strptime(timestamp_str, timestamp_format)
+
+
+# formats that can take the datetime.fromisoformat fast path (after ',' -> '.' fixup)
+_ISO_TIMESTAMP_FORMATS = {'%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S,%f',
+                          '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%S.%f'}
+
+# slash-date formats become ISO with one '/' -> '-' replace, skipping strptime too
+_SLASH_TIMESTAMP_FORMATS = {'%Y/%m/%d %H:%M:%S', '%Y/%m/%d %H:%M:%S.%f'}
+
+# current year for the no-year syslog format, refreshed at most once a minute
+_cached_year = 0
+_cached_year_expiry = 0.0
+
+
+def _current_year() -> int:
+    """
+    Get the current year, cached so timestamp parsing doesn't call datetime.now() per line.
+
+    Returns:
+        int: Current year
+    """
+    global _cached_year, _cached_year_expiry
+    now = time.monotonic()
+    if now >= _cached_year_expiry:
+        _cached_year = datetime.now().year
+        _cached_year_expiry = now + 60.0
+    return _cached_year
@@ -3,6 +3,7 @@ Collect data about memory usage.
 """
 from typing import Dict, List, Any
 from datetime import datetime
+import retention_rules
 
 error_message = None
 
@@ -13,6 +14,10 @@ except ModuleNotFoundError:
     psutil = None
 
 
+# event names emitted by this collector
+_EVENT_NAMES = ("memory_usage_percent", "memory_usage_mb")
+
+
 def init():
     """Initialize the data collector."""
     pass
@@ -35,7 +40,7 @@ def collect(config: Dict[str, Any], persistent_state: object, last_execution_tim
     
     mem = psutil.virtual_memory()
     mem_percent = mem.percent
-    mem_used_mb = mem.used / (1024 ** 2)
+    mem_used_mb = mem.used >> 20  # integer shift to MB, no float division
     return [{
         "name": "memory_usage_percent",
         "value": int(mem_percent)
@@ -56,14 +61,4 @@ def get_retention_rules(config: Dict[str, Any]) -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of retention rule dictionaries
     """
-    rules = [
-        {
-            "event_name": "memory_usage_percent",
-            "max_age_days": config.get('retention_days', 7)
-        },
-        {
-            "event_name": "memory_usage_mb",
-            "max_age_days": config.get('retention_days', 7)
-        }
-    ]
-    return rules
\ No newline at end of file
+    return retention_rules.build_retention_rules(_EVENT_NAMES, config.get('retention_days', 7))
@@ -1,8 +1,10 @@
 """
 Collect data about network usage.
 """
+import time
 from typing import Dict, List, Any
 from datetime import datetime
+import retention_rules
 
 error_message = None
 
@@ -12,15 +14,25 @@ except ModuleNotFoundError:
     error_message = "psutil module must be installed to use network usage collector!"
     psutil = None
 
+# bound once so the per-tick call skips the module attribute lookup
+_net_io_counters = psutil.net_io_counters if psutil is not None else None
 
 _last_values = None # type: ignore
 
+# monotonic stamp of the previous sample - immune to wall-clock jumps
+_last_sample_mono = 0.0
+
+
+# event names emitted by this collector
+_EVENT_NAMES = ("network_usage_bytes_sent_per_sec", "network_usage_bytes_recv_per_sec")
+
 
 def init():
     """Initialize the data collector."""
-    global _last_values
+    global _last_values, _last_sample_mono
     if psutil is not None:
-        _last_values = psutil.net_io_counters()
+        _last_values = _net_io_counters()
+        _last_sample_mono = time.monotonic()
 
 
 def collect(config: Dict[str, Any], persistent_state: object, last_execution_time: datetime) -> List[Dict[str, Any]]:
@@ -38,21 +50,23 @@ def collect(config: Dict[str, Any], persistent_state: object, last_execution_tim
     if psutil is None:
         return []
     
-    global _last_values
+    global _last_values, _last_sample_mono
+
+    # Get measurement interval from the monotonic clock
+    now = time.monotonic()
+    interval = (now - _last_sample_mono) or 1.0
 
-    # Get measurement interval
-    interval = (datetime.now() - last_execution_time).total_seconds()
-    
     # Take first measurement
     net1 = _last_values
-    net2 = psutil.net_io_counters()
-    
+    net2 = _net_io_counters()
+
     # Calculate bytes per second
     bytes_sent_per_sec = (net2.bytes_sent - net1.bytes_sent) / interval # type: ignore
     bytes_recv_per_sec = (net2.bytes_recv - net1.bytes_recv) / interval # type: ignore
-    
+
     # Update last values and time
     _last_values = net2
+    _last_sample_mono = now
 
     return [{
         "name": "network_usage_bytes_sent_per_sec",
@@ -74,14 +88,4 @@ def get_retention_rules(config: Dict[str, Any]) -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of retention rule dictionaries
     """
-    rules = [
-        {
-            "event_name": "network_usage_bytes_sent_per_sec",
-            "max_age_days": config.get('retention_days', 7)
-        },
-        {
-            "event_name": "network_usage_bytes_recv_per_sec",
-            "max_age_days": config.get('retention_days', 7)
-        }
-    ]
-    return rules
\ No newline at end of file
+    return retention_rules.build_retention_rules(_EVENT_NAMES, config.get('retention_days', 7))
@@ -1,18 +1,45 @@
 """
 Get processes count using psutil.
 """
+import os
+import sys
 from typing import Dict, List, Any
 from datetime import datetime
+import retention_rules
 
 error_message = None
 
 try:
     import psutil
-    
+
 except ModuleNotFoundError:
     error_message = "psutil module must be installed to use processes count collector!"
     psutil = None
 
+# on Linux we count numeric /proc entries directly - avoids psutil building a
+# full pid list (with an int object per process) just to take its length
+_use_proc_count = sys.platform.startswith('linux') and os.path.isdir('/proc')
+if _use_proc_count:
+    error_message = None
+
+
+def _count_processes() -> int:
+    """
+    Count running processes by scanning /proc for numeric entries.
+
+    Returns:
+        int: Number of processes
+    """
+    count = 0
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            count += 1
+    return count
+
+
+# event names emitted by this collector
+_EVENT_NAMES = ("processes_count",)
+
 
 def init():
     """Initialize the data collector."""
@@ -31,10 +58,10 @@ def collect(config: Dict[str, Any], persistent_state: object, last_execution_tim
     Returns:
         List[Dict[str, Any]]: List of event dictionaries collected from the data source
     """
-    if psutil is None:
+    if psutil is None and not _use_proc_count:
         return []
-    
-    processes_count = len(psutil.pids())
+
+    processes_count = _count_processes() if _use_proc_count else len(psutil.pids())
     return [{
         "name": "processes_count",
         "value": int(processes_count)
@@ -51,10 +78,4 @@ def get_retention_rules(config: Dict[str, Any]) -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of retention rule dictionaries
     """
-    rules = [
-        {
-            "event_name": "processes_count",
-            "max_age_days": config.get('retention_days', 7)
-        }
-    ]
-    return rules
\ No newline at end of file
+    return retention_rules.build_retention_rules(_EVENT_NAMES, config.get('retention_days', 7))
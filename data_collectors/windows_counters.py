@@ -7,356 +7,235 @@ import platform
 
 error_message = None
 
-# Only import WMI on Windows systems
-if platform.system() == "Windows":
+# resolved once - platform.system() costs a syscall on every call
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Only import PDH support on Windows systems
+if _IS_WINDOWS:
     try:
-        import wmi
-        import pythoncom
+        import win32pdh
     except ImportError:
-        error_message = "WMI module must be installed to use Windows counters collector!"
-        wmi = None
-        pythoncom = None
+        error_message = "pywin32 must be installed to use Windows counters collector!"
+        win32pdh = None
 else:
-    wmi = None
-    pythoncom = None
+    win32pdh = None
 
 
-def init():
-    """Initialize the data collector."""
-    if platform.system() != "Windows":
-        global error_message
-        error_message = "Windows counters collector can only be used on Windows systems!"
+# shared event name - one interned string instead of a literal per emission
+_NAME = "perf_counters"
 
+# right-shift for counters reported in bytes but emitted in MB
+_MB_SHIFT = 20
 
-def collect(config: Dict[str, Any], persistent_state: object, last_execution_time: datetime) -> List[Dict[str, Any]]:
+# Cooked PDH counter paths for single-instance metrics: (tag, counter path, MB shift).
+# PDH evaluates the counter formulas kernel-side, so rate counters arrive as true
+# per-second values and percentages as real percentages - no raw-tick math needed.
+_COUNTER_PATHS = (
+    ("processor_queue_length", r"\System\Processor Queue Length", 0),
+    ("available_memory_mb", r"\Memory\Available MBytes", 0),
+    ("pages_per_sec", r"\Memory\Pages/sec", 0),
+    ("context_switches_per_sec", r"\System\Context Switches/sec", 0),
+    ("process_count", r"\System\Processes", 0),
+    ("thread_count", r"\System\Threads", 0),
+    ("system_uptime_sec", r"\System\System Up Time", 0),
+    ("handle_count", r"\Process(_Total)\Handle Count", 0),
+    ("paging_file_usage_percent", r"\Paging File(_Total)\% Usage", 0),
+    ("cache_bytes_mb", r"\Memory\Cache Bytes", _MB_SHIFT),
+    ("committed_bytes_mb", r"\Memory\Committed Bytes", _MB_SHIFT),
+    ("pool_paged_bytes_mb", r"\Memory\Pool Paged Bytes", _MB_SHIFT),
+    ("pool_nonpaged_bytes_mb", r"\Memory\Pool Nonpaged Bytes", _MB_SHIFT),
+    ("system_calls_per_sec", r"\System\System Calls/sec", 0),
+    ("file_read_ops_per_sec", r"\System\File Read Operations/sec", 0),
+    ("file_write_ops_per_sec", r"\System\File Write Operations/sec", 0),
+    ("registry_quota_percent", r"\System\% Registry Quota In Use", 0),
+    ("cpu_usage_percent", r"\Processor(_Total)\% Processor Time", 0),
+)
+
+# persistent PDH query state - opened once and reused across collects
+_pdh_query = None
+_single_counters = None  # list of (tag, counter handle, MB shift)
+_disk_counters = None    # list of (disk name, queue handle, read handle, write handle)
+_net_counters = None     # list of (interface name, bytes handle, packets handle)
+
+# rebuild the query every N collects so hot-plugged disks / network adapters
+# are picked up without re-enumerating instances on every tick
+_REBUILD_EVERY_TICKS = 60
+_tick = 0
+
+
+def _build_query():
     """
-    Collect data from Windows Performance Counters.
-    
+    Open the persistent PDH query and register every counter with it.
+
+    Physical disks and network interfaces are enumerated once here and a
+    per-instance counter is added for each, so collect() only has to pick
+    the first relevant instance from already-registered handles.
+    """
+    global _pdh_query, _single_counters, _disk_counters, _net_counters
+    hq = win32pdh.OpenQuery()
+
+    single_counters = [(tag, win32pdh.AddCounter(hq, path), shift)
+                       for tag, path, shift in _COUNTER_PATHS]
+
+    disk_counters = []
+    _, instances = win32pdh.EnumObjectItems(None, None, "PhysicalDisk", win32pdh.PERF_DETAIL_WIZARD)
+    for name in instances:
+        if name and "_Total" not in name and "HarddiskVolume" not in name:
+            disk_counters.append((
+                name,
+                win32pdh.AddCounter(hq, rf"\PhysicalDisk({name})\Current Disk Queue Length"),
+                win32pdh.AddCounter(hq, rf"\PhysicalDisk({name})\Disk Read Bytes/sec"),
+                win32pdh.AddCounter(hq, rf"\PhysicalDisk({name})\Disk Write Bytes/sec"),
+            ))
+
+    net_counters = []
+    _, instances = win32pdh.EnumObjectItems(None, None, "Network Interface", win32pdh.PERF_DETAIL_WIZARD)
+    for name in instances:
+        if name and "Loopback" not in name and "_Total" not in name and "Teredo" not in name:
+            net_counters.append((
+                name,
+                win32pdh.AddCounter(hq, rf"\Network Interface({name})\Bytes Total/sec"),
+                win32pdh.AddCounter(hq, rf"\Network Interface({name})\Packets/sec"),
+            ))
+
+    _pdh_query = hq
+    _single_counters = single_counters
+    _disk_counters = disk_counters
+    _net_counters = net_counters
+
+
+def _read_counter(handle, shift: int = 0):
+    """
+    Read the formatted value of a PDH counter.
+
     Args:
-        config (Dict[str, Any]): Configuration dictionary for the data collector
-        persistent_state (object): Persistent state object to store collector state between runs and server executions
-        last_execution_time (datetime): The last time the collector was executed
+        handle: PDH counter handle
+        shift (int): Right-shift to scale the value with (e.g. 20 for bytes to MB)
 
     Returns:
-        List[Dict[str, Any]]: List of event dictionaries collected from the data source
+        Optional[int]: Counter value, or None when the counter has no data yet
+        (rate counters need two samples before the first value is available)
     """
-    
-    if platform.system() != "Windows":
-        return []
-    
-    if wmi is None:
-        return []
-    
-    events = []
-
-    global error_message
-    
     try:
-        # Initialize COM for this thread
-        if pythoncom is not None:
-            pythoncom.CoInitialize()
-        
-        # Connect to WMI
-        c = wmi.WMI()
-        
-        # 1. Processor Queue Length (shows CPU bottlenecks)
-        try:
-            processor_queue = c.Win32_PerfRawData_PerfOS_System()[0]
-            events.append({
-                "name": "perf_counters",
-                "value": int(processor_queue.ProcessorQueueLength),
-                "tag": "processor_queue_length"
-            })
-        except Exception as e:
-            error_message = f"Error getting processor queue length: {e}"
-            raise
-        
-        # 2. Available Memory (MB)
-        try:
-            memory_info = c.Win32_PerfRawData_PerfOS_Memory()[0]
-            available_mb = int(memory_info.AvailableMBytes)
-            events.append({
-                "name": "perf_counters", 
-                "value": available_mb,
-                "tag": "available_memory_mb"
-            })
-        except Exception as e:
-            error_message = f"Error getting available memory: {e}"
-            raise
+        # PDH_FMT_LARGE formats the value as a 64-bit int directly - no
+        # per-read float round trip and int() conversion
+        _, value = win32pdh.GetFormattedCounterValue(handle, win32pdh.PDH_FMT_LARGE)
+    except Exception:
+        return None
+    return value >> shift if shift else value
 
-        # 3. Pages/sec (memory pressure indicator)
-        try:
-            memory_info = c.Win32_PerfRawData_PerfOS_Memory()[0]
-            events.append({
-                "name": "perf_counters",
-                "value": int(memory_info.PagesPersec),
-                "tag": "pages_per_sec"
-            })
-        except Exception as e:
-            error_message = f"Error getting pages per sec: {e}"
-            raise
 
-        # 4. Context Switches/sec (system activity)
-        try:
-            system_info = c.Win32_PerfRawData_PerfOS_System()[0]
-            events.append({
-                "name": "perf_counters",
-                "value": int(system_info.ContextSwitchesPersec),
-                "tag": "context_switches_per_sec"
-            })
-        except Exception as e:
-            error_message = f"Error getting context switches: {e}"  
-            raise
-
-        # 5. Process Count
-        try:
-            system_info = c.Win32_PerfRawData_PerfOS_System()[0]
-            events.append({
-                "name": "perf_counters",
-                "value": int(system_info.Processes),
-                "tag": "process_count"
-            })
-        except Exception as e:
-            error_message = f"Error getting process count: {e}"
-            raise
+def _emit(events: List[Dict[str, Any]], value: int, tag: str):
+    """
+    Append one perf counter event to the events list.
 
-        # 6. Thread Count
-        try:
-            system_info = c.Win32_PerfRawData_PerfOS_System()[0]
-            events.append({
-                "name": "perf_counters",
-                "value": int(system_info.Threads),
-                "tag": "thread_count"
-            })
-        except Exception as e:
-            error_message = f"Error getting thread count: {e}"
-            raise
+    Args:
+        events (List[Dict[str, Any]]): Event list being built by collect()
+        value (int): Counter value
+        tag (str): Event tag identifying the counter
+    """
+    events.append({"name": _NAME, "value": value, "tag": tag})
 
-        # 7. System Up Time (seconds)
-        try:
-            system_info = c.Win32_PerfRawData_PerfOS_System()[0]
-            events.append({
-                "name": "perf_counters",
-                "value": int(system_info.SystemUpTime),
-                "tag": "system_uptime_sec"
-            })
-        except Exception as e:
-            error_message = f"Error getting system uptime: {e}" 
-            raise
 
-        # 8. Disk Queue Length (for first physical disk)
-        try:
-            disk_info = c.Win32_PerfRawData_PerfDisk_PhysicalDisk()
-            for disk in disk_info:
-                if disk.Name and "_Total" not in disk.Name and "HarddiskVolume" not in disk.Name:
-                    events.append({
-                        "name": "perf_counters",
-                        "value": int(disk.CurrentDiskQueueLength),
-                        "tag": f"disk_queue_length,disk:{disk.Name}"
-                    })
-                    break  # Only get first physical disk
-        except Exception as e:
-            error_message = f"Error getting disk queue length: {e}"
-            raise
+def init():
+    """Initialize the data collector."""
+    if not _IS_WINDOWS:
+        global error_message
+        error_message = "Windows counters collector can only be used on Windows systems!"
 
-        # 9. Handle Count
-        try:
-            # Use Process object to get total handles across all processes
-            processes = c.Win32_Process()
-            total_handles = sum(int(proc.HandleCount or 0) for proc in processes if proc.HandleCount is not None)
-            events.append({
-                "name": "perf_counters",
-                "value": total_handles,
-                "tag": "handle_count"
-            })
-        except Exception as e:
-            error_message = f"Error getting handle count: {e}"
-            raise
 
-        # 10. Network Interface Bytes Total/sec (for first active network interface)
-        try:
-            network_adapters = c.Win32_PerfRawData_Tcpip_NetworkInterface()
-            for adapter in network_adapters:
-                if adapter.Name and "Loopback" not in adapter.Name and "_Total" not in adapter.Name and "Teredo" not in adapter.Name:
-                    if int(adapter.BytesTotalPersec or 0) > 0:  # Only active interfaces
-                        events.append({
-                            "name": "perf_counters", 
-                            "value": int(adapter.BytesTotalPersec),
-                            "tag": f"network_bytes_per_sec,interface:{adapter.Name}"
-                        })
-                        events.append({
-                            "name": "perf_counters",
-                            "value": int(adapter.PacketsPersec or 0), 
-                            "tag": f"network_packets_per_sec,interface:{adapter.Name}"
-                        })
-                        break  # Only get first active interface
-        except Exception as e:
-            error_message = f"Error getting network interface stats: {e}"
-            raise
+def collect(config: Dict[str, Any], persistent_state: object, last_execution_time: datetime) -> List[Dict[str, Any]]:
+    """
+    Collect data from Windows Performance Counters.
 
-        # 11. Paging File Usage %
-        try:
-            paging_file = c.Win32_PerfRawData_PerfOS_PagingFile()
-            for pf in paging_file:
-                if pf.Name and "_Total" in pf.Name:
-                    usage_percent = int(pf.PercentUsage or 0)
-                    events.append({
-                        "name": "perf_counters",
-                        "value": usage_percent,
-                        "tag": "paging_file_usage_percent"
-                    })
-                    break
-        except Exception as e:
-            error_message = f"Error getting paging file usage: {e}"
-            raise
+    Args:
+        config (Dict[str, Any]): Configuration dictionary for the data collector
+        persistent_state (object): Persistent state object to store collector state between runs and server executions
+        last_execution_time (datetime): The last time the collector was executed
 
-        # 12. Cache Bytes
-        try:
-            memory_info = c.Win32_PerfRawData_PerfOS_Memory()[0]
-            cache_bytes = int(memory_info.CacheBytes or 0)
-            events.append({
-                "name": "perf_counters",
-                "value": cache_bytes // (1024 * 1024),  # Convert to MB
-                "tag": "cache_bytes_mb"
-            })
-        except Exception as e:
-            error_message = f"Error getting cache bytes: {e}"
-            raise
+    Returns:
+        List[Dict[str, Any]]: List of event dictionaries collected from the data source
+    """
 
-        # 13. Committed Bytes
-        try:
-            memory_info = c.Win32_PerfRawData_PerfOS_Memory()[0]
-            committed_bytes = int(memory_info.CommittedBytes or 0)
-            events.append({
-                "name": "perf_counters",
-                "value": committed_bytes // (1024 * 1024),  # Convert to MB
-                "tag": "committed_bytes_mb"
-            })
-        except Exception as e:
-            error_message = f"Error getting committed bytes: {e}"
-            raise
+    if not _IS_WINDOWS or win32pdh is None:
+        return []
 
-        # 14. Pool Paged Bytes
-        try:
-            memory_info = c.Win32_PerfRawData_PerfOS_Memory()[0]
-            pool_paged = int(memory_info.PoolPagedBytes or 0)
-            events.append({
-                "name": "perf_counters",
-                "value": pool_paged // (1024 * 1024),  # Convert to MB
-                "tag": "pool_paged_bytes_mb"
-            })
-        except Exception as e:
-            error_message = f"Error getting pool paged bytes: {e}"
-            raise
+    # the kernel only updates perf counters about once a second - polling
+    # faster than that just reads back duplicate data, so skip the tick
+    min_interval = config.get('min_interval_sec', 1)
+    if last_execution_time is not None and (datetime.now() - last_execution_time).total_seconds() < min_interval:
+        return []
 
-        # 15. Pool Non-paged Bytes
-        try:
-            memory_info = c.Win32_PerfRawData_PerfOS_Memory()[0]
-            pool_nonpaged = int(memory_info.PoolNonpagedBytes or 0)
-            events.append({
-                "name": "perf_counters",
-                "value": pool_nonpaged // (1024 * 1024),  # Convert to MB
-                "tag": "pool_nonpaged_bytes_mb"
-            })
-        except Exception as e:
-            error_message = f"Error getting pool non-paged bytes: {e}"
-            raise
+    events = []
 
-        # 16. System Calls/sec
-        try:
-            system_info = c.Win32_PerfRawData_PerfOS_System()[0]
-            syscalls = int(system_info.SystemCallsPersec or 0)
-            events.append({
-                "name": "perf_counters",
-                "value": syscalls,
-                "tag": "system_calls_per_sec"
-            })
-        except Exception as e:
-            error_message = f"Error getting system calls: {e}"
-            raise
+    global error_message, _pdh_query, _tick
 
-        # 17. File Read Operations/sec and File Write Operations/sec
+    try:
+        # Build the query and counter handles once, then refresh all counters
+        # with a single kernel perf-data read. Every _REBUILD_EVERY_TICKS
+        # collects the query is rebuilt to refresh the instance lists (rate
+        # counters then skip one tick until they have two samples again).
         try:
-            system_info = c.Win32_PerfRawData_PerfOS_System()[0]
-            file_reads = int(system_info.FileReadOperationsPersec or 0)
-            file_writes = int(system_info.FileWriteOperationsPersec or 0)
-            events.append({
-                "name": "perf_counters",
-                "value": file_reads,
-                "tag": "file_read_ops_per_sec"
-            })
-            events.append({
-                "name": "perf_counters", 
-                "value": file_writes,
-                "tag": "file_write_ops_per_sec"
-            })
+            _tick += 1
+            if _pdh_query is not None and _tick % _REBUILD_EVERY_TICKS == 0:
+                win32pdh.CloseQuery(_pdh_query)
+                _pdh_query = None
+            if _pdh_query is None:
+                _build_query()
+            win32pdh.CollectQueryData(_pdh_query)
         except Exception as e:
-            error_message = f"Error getting file operations: {e}"
+            error_message = f"Error collecting PDH counter data: {e}"
             raise
 
-        # 18. Registry Quota In Use %
-        try:
-            system_info = c.Win32_PerfRawData_PerfOS_System()[0]
-            registry_quota = int(system_info.PercentRegistryQuotaInUse or 0)
-            events.append({
-                "name": "perf_counters",
-                "value": registry_quota,
-                "tag": "registry_quota_percent"
-            })
-        except Exception as e:
-            error_message = f"Error getting registry quota: {e}"
-            raise
+        # Single-instance counters
+        for tag, handle, shift in _single_counters:
+            value = _read_counter(handle, shift)
+            if value is not None:
+                _emit(events, value, tag)
 
-        # 19. Processor Time % (for first processor)
+        # Disk queue length and read/write bytes per sec (for first physical disk)
         try:
-            processors = c.Win32_PerfRawData_PerfOS_Processor()
-            for proc in processors:
-                if proc.Name == "_Total":
-                    cpu_usage = 100 - int(proc.PercentIdleTime or 0)  # Invert idle time to get usage
-                    events.append({
-                        "name": "perf_counters",
-                        "value": max(0, min(100, cpu_usage)),  # Clamp to 0-100
-                        "tag": "cpu_usage_percent"
-                    })
-                    break
+            for name, queue_handle, read_handle, write_handle in _disk_counters:
+                queue_length = _read_counter(queue_handle)
+                if queue_length is not None:
+                    _emit(events, queue_length, f"disk_queue_length,disk:{name}")
+                read_bytes = _read_counter(read_handle)
+                if read_bytes is not None:
+                    _emit(events, read_bytes, f"disk_read_bytes_per_sec,disk:{name}")
+                write_bytes = _read_counter(write_handle)
+                if write_bytes is not None:
+                    _emit(events, write_bytes, f"disk_write_bytes_per_sec,disk:{name}")
+                break  # Only get first physical disk
         except Exception as e:
-            error_message = f"Error getting CPU usage: {e}"
+            error_message = f"Error getting disk counters: {e}"
             raise
 
-        # 20. Disk Read/Write Bytes per sec (for first physical disk)
+        # Network bytes and packets per sec (for first active network interface)
         try:
-            disk_info = c.Win32_PerfRawData_PerfDisk_PhysicalDisk()
-            for disk in disk_info:
-                if disk.Name and "_Total" not in disk.Name and "HarddiskVolume" not in disk.Name:
-                    read_bytes = int(disk.DiskReadBytesPersec or 0)
-                    write_bytes = int(disk.DiskWriteBytesPersec or 0)
-                    events.append({
-                        "name": "perf_counters",
-                        "value": read_bytes,
-                        "tag": f"disk_read_bytes_per_sec,disk:{disk.Name}"
-                    })
-                    events.append({
-                        "name": "perf_counters",
-                        "value": write_bytes,
-                        "tag": f"disk_write_bytes_per_sec,disk:{disk.Name}"
-                    })
-                    break  # Only get first physical disk
+            for name, bytes_handle, packets_handle in _net_counters:
+                bytes_per_sec = _read_counter(bytes_handle)
+                if not bytes_per_sec:  # Only active interfaces
+                    continue
+                _emit(events, bytes_per_sec, f"network_bytes_per_sec,interface:{name}")
+                packets_per_sec = _read_counter(packets_handle)
+                if packets_per_sec is not None:
+                    _emit(events, packets_per_sec, f"network_packets_per_sec,interface:{name}")
+                break  # Only get first active interface
         except Exception as e:
-            error_message = f"Error getting disk read/write bytes: {e}"
+            error_message = f"Error getting network interface counters: {e}"
             raise
 
     except Exception as e:
-        error_message = f"Error connecting to WMI: {e}"
-        raise
-
-    finally:
-        # Clean up COM initialization
+        error_message = error_message or f"Error collecting Windows counters: {e}"
+        # drop the query so the next tick rebuilds the handles from scratch
         try:
-            if pythoncom is not None:
-                pythoncom.CoUninitialize()
-        except:
+            if _pdh_query is not None:
+                win32pdh.CloseQuery(_pdh_query)
+        except Exception:
             pass
-    
+        _pdh_query = None
+        raise
+
     error_message = None
     return events
 
@@ -364,10 +243,10 @@ def collect(config: Dict[str, Any], persistent_state: object, last_execution_tim
 def get_retention_rules(config: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Get retention rules for the data collector.
-    
+
     Args:
         config (Dict[str, Any]): Configuration dictionary for the data collector
-        
+
     Returns:
         List[Dict[str, Any]]: List of retention rule dictionaries
     """
@@ -377,4 +256,4 @@ def get_retention_rules(config: Dict[str, Any]) -> List[Dict[str, Any]]:
             "max_age_days": config.get('retention_days', 7)
         }
     ]
-    return rules
\ No newline at end of file
+    return rules
@@ -5,17 +5,25 @@ Created: 2025.
 """
 import sqlite3
 import threading
+from itertools import islice
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Union, Sequence
 import logger
 
 log = logger.get_logger(__name__)
 
+# explicit timestamp adapter: binds datetimes as 'YYYY-MM-DD HH:MM:SS[.ffffff]'
+# TEXT - the same format existing databases already store, so old and new rows
+# stay comparable - without going through the stdlib's implicit default
+# adapter, which is deprecated since Python 3.12
+sqlite3.register_adapter(datetime, lambda ts: ts.isoformat(' '))
+
 
 class Event:
     """
     Represents a single analytics event.
     """
+    __slots__ = ("name", "value", "tag", "additional_info", "timestamp")
 
     def __init__(self, name: str, value: int = 0, tag: Optional[str] = None, additional_info: Optional[str] = None, timestamp: Optional[datetime] = None) -> None:
         """
@@ -37,6 +45,34 @@ class Event:
         self.timestamp = timestamp or datetime.now()
 
 
+# rows per executemany batch when bulk inserting - caps how much data piles up
+# in a single transaction for very large bursts
+_INSERT_CHUNK_SIZE = 10000
+
+
+def _event_rows(events: Sequence[Union[Event, Dict[str, Any]]], current_time: datetime):
+    """
+    Yield insert parameter tuples for the given events, skipping invalid entries.
+
+    Args:
+        events (Sequence[Union[Event, Dict[str, Any]]]): Event objects or dictionaries to convert
+        current_time (datetime): Timestamp to use for events that don't carry one
+
+    Yields:
+        tuple: (name, value, tag, additional_info, timestamp) ready for executemany
+    """
+    for event in events:
+        # dicts first - that's what collectors emit, so it's the hot shape
+        if isinstance(event, dict):
+            get = event.get
+            yield (get('name'), get('value', 0), get('tag'),
+                   get('additional_info'), get('timestamp') or current_time)
+        elif isinstance(event, Event):
+            yield (event.name, event.value, event.tag, event.additional_info, event.timestamp or current_time)
+        else:
+            log.warning(f"Skipping invalid event type: {type(event)}")
+
+
 class DatabaseManager:
     """
     Manage the SQLite database for storing and retrieving analytics counters.
@@ -52,6 +88,16 @@ class DatabaseManager:
         self.db_path = db_path
         self._local = threading.local()
 
+        # serializes writers in-process: sqlite only allows one writer at a
+        # time anyway, so queueing on a lock beats spinning on SQLITE_BUSY
+        self._write_lock = threading.Lock()
+
+        # caches for the whole-table name aggregates, keyed by write generation:
+        # every successful write bumps _write_gen, which invalidates both
+        self._write_gen = 0
+        self._names_cache = None   # (write_gen, List[str])
+        self._counts_cache = None  # (write_gen, List[Dict[str, Any]])
+
     def connect(self) -> None:
         """
         Initialize the database connection.
@@ -60,8 +106,25 @@ class DatabaseManager:
             None
         """
         log.info(f"Connecting to database {self.db_path} on thread {threading.get_ident()}.")
-        self._local.conn = sqlite3.connect(self.db_path)
-        self._local.conn.row_factory = sqlite3.Row
+        # enlarged statement cache so hot queries skip the SQL parser entirely;
+        # isolation_level=None means autocommit with explicit BEGIN/COMMIT where
+        # we batch, instead of the sqlite3 module's implicit transactions
+        conn = sqlite3.connect(self.db_path, cached_statements=256, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+
+        # tune the connection for our workload: WAL lets the cleanup job read while
+        # collectors write, and synchronous=NORMAL moves the fsync cost from every
+        # commit to WAL checkpoints (safe under WAL - a crash can only lose the
+        # last commits, not corrupt the database). Skipped for in-memory databases.
+        if self.db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA busy_timeout=5000")
+
+        self._local.conn = conn
     
     def get_connection(self) -> sqlite3.Connection:
         """
@@ -75,6 +138,41 @@ class DatabaseManager:
         return self._local.conn
 
 
+    @staticmethod
+    def _tag_filter(tags: Union[str, List[str]], params: List[Any], column: str = 'tag') -> str:
+        """
+        Build a tag filter SQL clause and append its bind parameters to params.
+
+        Tag lists are padded to the next power-of-two length by repeating the
+        last tag, so the generated SQL text only varies with the bucket size.
+        This lets the connection's prepared-statement cache reuse the same
+        compiled statement across calls with different tag counts.
+
+        Args:
+            tags (Union[str, List[str]]): Single tag or list of tags to filter by
+            params (List[Any]): Query parameter list to append bind values to
+            column (str): Column name to filter on (default: 'tag')
+
+        Returns:
+            str: SQL clause to append to the query (empty for an empty tag list)
+        """
+        if isinstance(tags, list):
+            if len(tags) == 0:
+                return ''
+            if len(tags) == 1:
+                params.append(tags[0])
+                return f' AND {column} = ?'
+            count = 2
+            while count < len(tags):
+                count *= 2
+            params.extend(tags)
+            params.extend([tags[-1]] * (count - len(tags)))
+            placeholders = ','.join(['?'] * count)
+            return f' AND {column} IN ({placeholders})'
+        params.append(tags)
+        return f' AND {column} = ?'
+
+
     def init_database(self) -> None:
         """
         Initialize the database and create the Counters table if it doesn't exist.
@@ -100,17 +198,21 @@ class DatabaseManager:
                 )
             ''')
             
-            # Create index on name, tag and timestamp for faster lookups
+            # Composite indexes matching the query shapes (filter by name and
+            # optionally tag, order by timestamp) - queries walk a bounded index
+            # range in order instead of merging single-column indexes and sorting
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_events_name ON Events(name)
+                CREATE INDEX IF NOT EXISTS idx_events_name_ts ON Events(name, timestamp)
             ''')
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_events_tag ON Events(tag)
-            ''')
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_events_timestamp ON Events(timestamp)
+                CREATE INDEX IF NOT EXISTS idx_events_name_tag_ts ON Events(name, tag, timestamp)
             ''')
 
+            # Drop the old single-column indexes superseded by the above
+            cursor.execute('DROP INDEX IF EXISTS idx_events_name')
+            cursor.execute('DROP INDEX IF EXISTS idx_events_tag')
+            cursor.execute('DROP INDEX IF EXISTS idx_events_timestamp')
+
             conn.commit()
 
 
@@ -155,18 +257,19 @@ class DatabaseManager:
             bool: True if successful, False otherwise
         """
         try:
-            with self.get_connection() as conn:
+            with self._write_lock, self.get_connection() as conn:
                 cursor = conn.cursor()
                 
                 if timestamp is None:
                     timestamp = datetime.now()
                 
+                # plain INSERT - the table has no UNIQUE constraint, so OR REPLACE
+                # only added a pointless per-row conflict probe
                 cursor.execute('''
-                    INSERT OR REPLACE INTO Events (name, value, tag, additional_info, timestamp)
+                    INSERT INTO Events (name, value, tag, additional_info, timestamp)
                     VALUES (?, ?, ?, ?, ?)
                 ''', (name, value, tag, additional_info, timestamp))
-
-                conn.commit()
+                self._write_gen += 1
                 return True
             
         except sqlite3.Error as e:
@@ -190,44 +293,32 @@ class DatabaseManager:
             return True
             
         try:
-            with self.get_connection() as conn:
+            with self._write_lock, self.get_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Prepare data for bulk insert
-                event_data = []
-                current_time = datetime.now()
-                
-                for event in events:
-                    if isinstance(event, Event):
-                        # Handle Event object
-                        event_data.append((
-                            event.name,
-                            event.value,
-                            event.tag,
-                            event.additional_info,
-                            event.timestamp or current_time
-                        ))
-                    elif isinstance(event, dict):
-                        # Handle dictionary
-                        event_data.append((
-                            event.get('name'),
-                            event.get('value', 0),
-                            event.get('tag'),
-                            event.get('additional_info'),
-                            event.get('timestamp') or current_time
-                        ))
-                    else:
-                        log.warning(f"Skipping invalid event type: {type(event)}")
-                        continue
-                
-                # Bulk insert using executemany
-                cursor.executemany('''
-                    INSERT OR REPLACE INTO Events (name, value, tag, additional_info, timestamp)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', event_data)
 
-                conn.commit()
-                log.debug(f"Successfully inserted {len(event_data)} events in bulk")
+                # Stream rows from a generator instead of materializing one big
+                # tuple list, chunking so huge bursts don't bloat one transaction
+                rows = _event_rows(events, datetime.now())
+                inserted_count = 0
+                while True:
+                    chunk = list(islice(rows, _INSERT_CHUNK_SIZE))
+                    if not chunk:
+                        break
+                    conn.execute("BEGIN")
+                    try:
+                        cursor.executemany('''
+                            INSERT INTO Events (name, value, tag, additional_info, timestamp)
+                            VALUES (?, ?, ?, ?, ?)
+                        ''', chunk)
+                        conn.execute("COMMIT")
+                    except Exception:
+                        conn.execute("ROLLBACK")
+                        raise
+                    inserted_count += len(chunk)
+
+                if inserted_count:
+                    self._write_gen += 1
+                log.debug(f"Successfully inserted {inserted_count} events in bulk")
                 return True
             
         except sqlite3.Error as e:
@@ -249,56 +340,79 @@ class DatabaseManager:
             List[Event]: List of Event objects
         """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Build the query dynamically based on filters
-                query = 'SELECT name, value, tag, additional_info, timestamp FROM Events WHERE name = ?'
-                params: List[Any] = [name]
-                
-                # Add max_age_days filter if provided
-                if max_age_days > 0:
-                    cutoff_date = datetime.now() - timedelta(days=max_age_days)
-                    query += ' AND timestamp >= ?'
-                    params.append(cutoff_date)
-                
-                # Add tag filter if provided
-                if tags is not None:
-                    if isinstance(tags, list):
-                        if len(tags) == 1:
-                            # Single tag in list - simple comparison
-                            query += ' AND tag = ?'
-                            params.append(tags[0])
-                        elif len(tags) > 1:
-                            # Multiple tags - use IN clause
-                            placeholders = ','.join(['?'] * len(tags))
-                            query += f' AND tag IN ({placeholders})'
-                            params.extend(tags)
-                    else:
-                        # Single string tag - simple comparison
-                        query += ' AND tag = ?'
-                        params.append(tags)
-                
-                # If limit is provided, order DESC to get most recent first, then reverse
-                if max_results > 0:
-                    query += ' ORDER BY timestamp DESC LIMIT ?'
-                    params.append(max_results)
-                    cursor.execute(query, params)
-                    rows = cursor.fetchall()
-                    return [dict(row) for row in reversed(rows)] # Reverse to get chronological order (oldest first)
-                
-                # No limit, just order chronologically
-                else:
-                    query += ' ORDER BY timestamp ASC'
-                    cursor.execute(query, params)
-                    rows = cursor.fetchall()
-                    return [dict(row) for row in rows]
+            # No limit - collect from the streaming iterator
+            if max_results <= 0:
+                return list(self.iter_events(name, tags, max_age_days))
+
+            # reads don't need the commit-on-exit context manager
+            conn = self.get_connection()
+
+            # Build the query dynamically based on filters
+            query = 'SELECT name, value, tag, additional_info, timestamp FROM Events WHERE name = ?'
+            params: List[Any] = [name]
+
+            # Add max_age_days filter if provided
+            if max_age_days > 0:
+                cutoff_date = datetime.now() - timedelta(days=max_age_days)
+                query += ' AND timestamp >= ?'
+                params.append(cutoff_date)
+
+            # Add tag filter if provided
+            if tags is not None:
+                query += self._tag_filter(tags, params)
+
+            # Order DESC to get most recent first, then reverse
+            query += ' ORDER BY timestamp DESC LIMIT ?'
+            params.append(max_results)
+            rows = conn.execute(query, params).fetchall()
+            return [dict(row) for row in reversed(rows)] # Reverse to get chronological order (oldest first)
 
         except sqlite3.Error as e:
             log.error(f"Error getting all events: {e}")
             return []
 
 
+    def iter_events(self, name: str, tags: Optional[Union[str, List[str]]] = None, max_age_days: int = 0):
+        """
+        Iterate events matching the given filters in chronological order.
+
+        Rows are fetched in chunks of 1000, so peak memory stays bounded no
+        matter how large the result set is - use this instead of get_events
+        when the caller can consume events one at a time.
+
+        Args:
+            name (str): Event name to filter by (required).
+            tags (str | List[str]): If provided, will filter by tag. Can be a single tag or list of tags.
+            max_age_days (int): If provided, will only return events younger than this many days.
+
+        Yields:
+            Dict[str, Any]: Event dictionaries, oldest first.
+        """
+        conn = self.get_connection()
+
+        query = 'SELECT name, value, tag, additional_info, timestamp FROM Events WHERE name = ?'
+        params: List[Any] = [name]
+
+        if max_age_days > 0:
+            cutoff_date = datetime.now() - timedelta(days=max_age_days)
+            query += ' AND timestamp >= ?'
+            params.append(cutoff_date)
+
+        if tags is not None:
+            query += self._tag_filter(tags, params)
+
+        query += ' ORDER BY timestamp ASC'
+
+        cursor = conn.execute(query, params)
+        cursor.arraysize = 1000
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+
+
     def get_latest_events_by_tag(self, name: str, tags: Optional[Union[str, List[str]]] = None) -> List[Dict[str, Any]]:
         """
         Get the most recent event for each distinct tag value.
@@ -311,63 +425,34 @@ class DatabaseManager:
             List[Dict[str, Any]]: List of the most recent events, one per unique tag
         """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Query to get the most recent event for each tag
-                query = '''
-                    SELECT e1.name, e1.value, e1.tag, e1.additional_info, e1.timestamp 
-                    FROM Events e1
-                    INNER JOIN (
-                        SELECT tag, MAX(timestamp) as max_timestamp
-                        FROM Events 
-                        WHERE name = ?
-                '''
-                params: List[Any] = [name]
-                
-                # Add tag filter to subquery if provided
-                if tags is not None:
-                    if isinstance(tags, list):
-                        if len(tags) == 1:
-                            query += ' AND tag = ?'
-                            params.append(tags[0])
-                        elif len(tags) > 1:
-                            placeholders = ','.join(['?'] * len(tags))
-                            query += f' AND tag IN ({placeholders})'
-                            params.extend(tags)
-                    else:
-                        query += ' AND tag = ?'
-                        params.append(tags)
-                
-                # Complete the subquery and join
-                query += '''
-                        GROUP BY tag
-                    ) e2 ON e1.tag = e2.tag AND e1.timestamp = e2.max_timestamp
-                    WHERE e1.name = ?
-                '''
-                params.append(name)
-                
-                # Add tag filter to main query if provided
-                if tags is not None:
-                    if isinstance(tags, list):
-                        if len(tags) == 1:
-                            query += ' AND e1.tag = ?'
-                            params.append(tags[0])
-                        elif len(tags) > 1:
-                            placeholders = ','.join(['?'] * len(tags))
-                            query += f' AND e1.tag IN ({placeholders})'
-                            params.extend(tags)
-                    else:
-                        query += ' AND e1.tag = ?'
-                        params.append(tags)
-                
-                # Order by tag for consistent results
-                query += ' ORDER BY e1.tag'
+            conn = self.get_connection()
+
+            # Rank events per tag newest-first in a single index-ordered pass,
+            # then keep the top row of each partition
+            query = '''
+                WITH ranked AS (
+                    SELECT name, value, tag, additional_info, timestamp,
+                           ROW_NUMBER() OVER (PARTITION BY tag ORDER BY timestamp DESC) AS rn
+                    FROM Events
+                    WHERE name = ? AND tag IS NOT NULL
+            '''
+            params: List[Any] = [name]
+
+            # Add tag filter if provided
+            if tags is not None:
+                query += self._tag_filter(tags, params)
+
+            query += '''
+                )
+                SELECT name, value, tag, additional_info, timestamp
+                FROM ranked
+                WHERE rn = 1
+                ORDER BY tag
+            '''
 
-                # Execute and return results
-                cursor.execute(query, params)
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+            # Execute and return results
+            rows = conn.execute(query, params).fetchall()
+            return [dict(row) for row in rows]
 
         except sqlite3.Error as e:
             log.error(f"Error getting latest events by tag: {e}")
@@ -381,17 +466,25 @@ class DatabaseManager:
         Returns:
             List[str]: List of unique event names
         """
+        cached = self._names_cache
+        if cached is not None and cached[0] == self._write_gen:
+            return list(cached[1])
+
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Query to get distinct event names
-                query = 'SELECT DISTINCT name FROM Events ORDER BY name'
-                
-                # Execute and return results
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                return [row[0] for row in rows]
+            conn = self.get_connection()
+
+            # snapshot the generation before querying, so a write that lands
+            # mid-query just makes this cache entry stale instead of wrong
+            write_gen = self._write_gen
+
+            # Query to get distinct event names
+            query = 'SELECT DISTINCT name FROM Events ORDER BY name'
+
+            # Execute and return results
+            rows = conn.execute(query).fetchall()
+            names = [row[0] for row in rows]
+            self._names_cache = (write_gen, names)
+            return list(names)
 
         except sqlite3.Error as e:
             log.error(f"Error getting event names: {e}")
@@ -405,17 +498,24 @@ class DatabaseManager:
         Returns:
             List[Dict[str, Any]]: List of dictionaries with 'name' and 'count' keys, sorted by name
         """
+        cached = self._counts_cache
+        if cached is not None and cached[0] == self._write_gen:
+            return list(cached[1])
+
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Query to get distinct event names with counts
-                query = 'SELECT name, COUNT(*) as count FROM Events GROUP BY name ORDER BY name'
-                
-                # Execute and return results
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                return [{'name': row[0], 'count': row[1]} for row in rows]
+            conn = self.get_connection()
+
+            # snapshot the generation before querying (see get_event_names)
+            write_gen = self._write_gen
+
+            # Query to get distinct event names with counts
+            query = 'SELECT name, COUNT(*) as count FROM Events GROUP BY name ORDER BY name'
+
+            # Execute and return results
+            rows = conn.execute(query).fetchall()
+            counts = [{'name': row[0], 'count': row[1]} for row in rows]
+            self._counts_cache = (write_gen, counts)
+            return list(counts)
 
         except sqlite3.Error as e:
             log.error(f"Error getting event names with counts: {e}")
@@ -435,7 +535,7 @@ class DatabaseManager:
             int: Number of events deleted.
         """
         try:
-            with self.get_connection() as conn:
+            with self._write_lock, self.get_connection() as conn:
 
                 cursor = conn.cursor()
                 
@@ -455,6 +555,8 @@ class DatabaseManager:
 
                 deleted_count = cursor.rowcount
                 conn.commit()
+                if deleted_count:
+                    self._write_gen += 1
 
                 print(f"Deleted {deleted_count} events older than {days} days")
                 return deleted_count
@@ -464,6 +566,74 @@ class DatabaseManager:
             return 0
 
 
+    def delete_old_events_batch(self, rules: List[Dict[str, Any]]) -> int:
+        """
+        Delete old events for a batch of retention rules in a single transaction.
+
+        Args:
+            rules (List[Dict[str, Any]]): Retention rules, each with 'event_name',
+                'max_age_days' and an optional 'tag' key.
+
+        Returns:
+            int: Total number of events deleted.
+        """
+        if not rules:
+            return 0
+
+        try:
+            with self._write_lock, self.get_connection() as conn:
+                cursor = conn.cursor()
+                now = datetime.now()
+                deleted_count = 0
+
+                # one commit (and one fsync) for the whole batch instead of one per rule
+                conn.execute("BEGIN")
+                try:
+                    for rule in rules:
+                        cutoff_date = now - timedelta(days=rule["max_age_days"])
+                        tag = rule.get("tag")
+                        if tag:
+                            cursor.execute('''
+                                DELETE FROM Events
+                                WHERE name = ? AND tag = ? AND timestamp < ?
+                            ''', (rule["event_name"], tag, cutoff_date))
+                        else:
+                            cursor.execute('''
+                                DELETE FROM Events
+                                WHERE name = ? AND timestamp < ?
+                            ''', (rule["event_name"], cutoff_date))
+                        deleted_count += cursor.rowcount
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+
+                if deleted_count:
+                    self._write_gen += 1
+                return deleted_count
+
+        except sqlite3.Error as e:
+            log.error(f"Error deleting old events in batch: {e}")
+            return 0
+
+
+    def checkpoint_wal(self) -> None:
+        """
+        Checkpoint and truncate the write-ahead log.
+        Called periodically (from the old events cleanup job) so the WAL file
+        doesn't grow unbounded if automatic checkpoints are starved by writers.
+
+        Returns:
+            None
+        """
+        if self.db_path == ":memory:":
+            return
+        try:
+            self.get_connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            log.error(f"Error checkpointing WAL: {e}")
+
+
     def close(self) -> None:
         """
         Close the database connection (if using persistent connections).
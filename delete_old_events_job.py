@@ -24,29 +24,32 @@ def delete_old_events():
     # iterate over data collectors and collect data
     for data_collector in data_collectors:
 
-        total_deleted_count = 0
-        rules = data_collector.get_retention_rules()
+        # the rules come from the collector module, which is lazily loaded and
+        # init'ed here - a broken collector must not abort cleanup for the rest
+        try:
+            rules = data_collector.get_retention_rules()
+        except Exception as e:
+            log.error(f"Failed getting retention rules from {data_collector.module_name}: {e}")
+            continue
         for rule in rules:
 
             # validate rule
             if 'event_name' not in rule:
                 log.error(f"Skipping invalid retention rule from {data_collector.module_name}: missing 'name' key.")
-                return 
-            
+                return
+
             if 'max_age_days' not in rule:
                 log.error(f"Skipping invalid retention rule from {data_collector.module_name}: missing 'max_age_days' key.")
                 return
 
-            # delete old events
-            event_name = rule["event_name"]
-            age_days = rule["max_age_days"]
-            tag = rule.get("tag")
-            deleted_count = db.delete_old_events(event_name, tag, age_days)
-            log.info(f"Deleted {deleted_count} old events of type '{event_name}' from the database.")
-            total_deleted_count += deleted_count
-        
+        # delete old events for all the collector's rules in one transaction
+        total_deleted_count = db.delete_old_events_batch(rules)
+        log.info(f"Deleted {total_deleted_count} old events for collector '{data_collector.module_name}' from the database.")
         data_collector.add_deleted_events_count(total_deleted_count)
 
+    # truncate the write-ahead log while we're already doing maintenance
+    db.checkpoint_wal()
+
     log.debug(f"Finished old events cleanup job!")
 
 # register the old events deletion task to run periodically
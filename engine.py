@@ -102,7 +102,7 @@ db.init_database()
 # add the collect events job
 log.info("Init job to run event collectors..")
 import collect_events_job
-collect_events_job.data_collectors = data_collectors
+collect_events_job.init(data_collectors)
 collect_events_job.db = db
 
 # add the delete old events job
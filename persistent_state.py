@@ -4,6 +4,7 @@ Author: Ronen Ness.
 Created: 2025.
 """
 import json
+import os
 
 class PersistentState:
     """
@@ -18,6 +19,9 @@ class PersistentState:
         return self._state.get(key, default)
 
     def set(self, key, value):
+        # skip no-op writes so unchanged state doesn't trigger a save on the next collect
+        if key in self._state and self._state[key] == value:
+            return
         self._state[key] = value
         self._dirty = True
 
@@ -36,9 +40,12 @@ class PersistentState:
     def save(self, path, only_if_dirty=False):
         if only_if_dirty and not self._dirty:
             return
-        with open(path, 'w') as f:
-            json.dump(self._state, f)
-            f.flush()
+        # serialize once and swap the file in atomically - a single write instead of
+        # json.dump's many small ones, and a crash mid-save can't corrupt the state file
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(json.dumps(self._state))
+        os.replace(tmp_path, path)
         self._dirty = False
 
     def load(self, path, must_exist=False):
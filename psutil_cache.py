@@ -0,0 +1,81 @@
+"""
+Small TTL cache around psutil queries, shared by the data collectors.
+Caching values for ~100 ms avoids repeated /proc reads and syscalls when
+several collectors query the same metrics in the same scheduler tick.
+Author: Ronen Ness.
+Created: 2025.
+"""
+import time
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    import psutil
+except ModuleNotFoundError:
+    psutil = None
+
+# default time-to-live for cached values, in seconds
+DEFAULT_TTL = 0.1
+
+# cache of key -> (expiry monotonic time, value)
+_cache: Dict[Any, Tuple[float, Any]] = {}
+
+
+def _cached(key: Any, fetch: Callable[[], Any], max_age_s: float) -> Any:
+    """
+    Return the cached value for key if it's still fresh, otherwise fetch and cache it.
+
+    Args:
+        key (Any): Cache key
+        fetch (Callable[[], Any]): Function to fetch a fresh value
+        max_age_s (float): Time-to-live for the cached value, in seconds
+
+    Returns:
+        Any: Cached or freshly fetched value
+    """
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is not None and now < entry[0]:
+        return entry[1]
+    value = fetch()
+    _cache[key] = (now + max_age_s, value)
+    return value
+
+
+def get_cpu_percent(max_age_s: float = DEFAULT_TTL) -> float:
+    """
+    Get system CPU usage percent (cached).
+
+    Args:
+        max_age_s (float): Max age of the cached value, in seconds
+
+    Returns:
+        float: CPU usage percent
+    """
+    return _cached("cpu_percent", psutil.cpu_percent, max_age_s)
+
+
+def get_disk_usage(path: str, max_age_s: float = DEFAULT_TTL):
+    """
+    Get disk usage for the given path (cached per path).
+
+    Args:
+        path (str): Mount path to query
+        max_age_s (float): Max age of the cached value, in seconds
+
+    Returns:
+        psutil disk usage tuple (total, used, free, percent)
+    """
+    return _cached(("disk_usage", path), lambda: psutil.disk_usage(path), max_age_s)
+
+
+def get_disk_io_counters(max_age_s: float = DEFAULT_TTL):
+    """
+    Get system-wide disk io counters (cached).
+
+    Args:
+        max_age_s (float): Max age of the cached value, in seconds
+
+    Returns:
+        psutil disk io counters tuple
+    """
+    return _cached("disk_io_counters", psutil.disk_io_counters, max_age_s)
@@ -0,0 +1,29 @@
+"""
+Shared helper to build retention rule lists for data collectors.
+Author: Ronen Ness.
+Created: 2025.
+"""
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+
+@lru_cache(maxsize=32)
+def _cached_rules(event_names: Tuple[str, ...], max_age_days: int) -> Tuple[Dict[str, Any], ...]:
+    """Build (once per distinct input) the retention rules for the given event names and max age."""
+    return tuple({"event_name": name, "max_age_days": max_age_days} for name in event_names)
+
+
+def build_retention_rules(event_names: Tuple[str, ...], max_age_days: int) -> List[Dict[str, Any]]:
+    """
+    Build a retention rules list for the given event names (cached internally).
+    Every call returns a fresh list of fresh dicts, so callers may mutate the
+    result without poisoning what later calls get back.
+
+    Args:
+        event_names (Tuple[str, ...]): Event names the collector emits
+        max_age_days (int): Number of days to keep events for
+
+    Returns:
+        List[Dict[str, Any]]: List of retention rule dictionaries
+    """
+    return [dict(rule) for rule in _cached_rules(event_names, max_age_days)]